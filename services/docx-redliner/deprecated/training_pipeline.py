@@ -14,12 +14,18 @@ Features:
 
 import os
 import json
+import hashlib
+import logging
+import unicodedata
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from docx import Document
 from collections import defaultdict, Counter
+import bisect
 import difflib
+import fnmatch
 from datetime import datetime
+from functools import lru_cache
 import re
 
 # Import dish database for storing learned dish information
@@ -33,7 +39,8 @@ try:
         extract_restaurant,
         extract_menu_date,
         extract_menu_type,
-        get_statistics as get_dish_db_stats
+        get_statistics as get_dish_db_stats,
+        batch as dish_db_batch
     )
     DISH_DB_AVAILABLE = True
 except ImportError:
@@ -59,6 +66,115 @@ except ImportError:
     def is_terminology_correction(x): return False
     def get_context_hints(x, y): return {}
 
+# Valid allergen codes (single letters and two-letter codes)
+_ALLERGEN_CODES = frozenset({'d', 'n', 'g', 'v', 's', 'e', 'f', 'c', 'm', 'se', 'sy', 's*'})
+
+# Pattern for allergen strings: comma-separated codes, possibly with asterisks
+_ALLERGEN_CODES_RE = re.compile(r'^[a-z,\*]+$')
+
+
+class _PunctuationTable(dict):
+    r"""
+    str.translate table that deletes punctuation - anything that is neither a
+    word character nor whitespace, the same set r'[^\w\s]' matches.
+
+    Filled in lazily: a code point is classified the first time it is seen,
+    so the table only ever holds the characters menus actually contain.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        if char.isalnum() or char == '_' or char.isspace():
+            value = codepoint
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_PUNCT_TABLE = _PunctuationTable()
+
+# The ASCII characters that table deletes, for the bytes.translate fast path
+_ASCII_PUNCT_BYTES = bytes(cp for cp in range(128) if _PUNCT_TABLE[cp] is None)
+
+
+def _strip_punctuation(text: str) -> str:
+    """Remove punctuation (see _PunctuationTable) from text."""
+    # Most menu text is plain ASCII - bytes.translate is a single table scan
+    if text.isascii():
+        return text.encode('ascii').translate(None, _ASCII_PUNCT_BYTES).decode('ascii')
+    return text.translate(_PUNCT_TABLE)
+
+# Leading list/numbering markers in front of a dish name ("1. ", "2) ", "- ")
+_LEAD_FMT_RE = re.compile(r'^[\d\.\)\-\s]+')
+
+# Signs of a menu item line, any one is enough: comma-separated ingredients,
+# a trailing price ("18", "12|15") or trailing allergen codes ("D,G")
+_MENU_ITEM_RE = re.compile(r', |\s+\d+(?:\|\d+)?\s*$|\s+[A-Z,]+\s*$')
+
+# Approved-document lines that are never dishes: the raw-food warning, and
+# page numbers / template headers
+_SKIP_PHRASES = ('consuming raw', 'foodborne')
+_SKIP_PREFIXES = ('page', 'menu', 'restaurant', 'venue')
+
+# Per-correction trace output. Off by default - set TRAINING_PIPELINE_DEBUG=1
+# to see every tracked change as it is found.
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _canonical_text(text: str) -> str:
+    """
+    NFC-normalize text read from a document.
+
+    The small cache covers runs that repeat within and between the original
+    and redlined copies of a menu without keeping whole documents alive.
+    """
+    return unicodedata.normalize('NFC', text)
+
+
+@lru_cache(maxsize=8192)
+def _strip_diacritics(text: str) -> str:
+    """Remove combining marks (jalapeño → jalapeno) via NFD decomposition."""
+    return ''.join(c for c in unicodedata.normalize('NFD', text)
+                   if unicodedata.category(c) != 'Mn')
+
+
+@lru_cache(maxsize=16384)
+def _folded_forms(text: str) -> Tuple[str, str]:
+    """
+    Return (lowercased-and-stripped, same without diacritics) for text.
+
+    The same few thousand correction strings are compared over and over
+    while generating rules, so each unique string is only folded once.
+    """
+    lower = text.lower().strip()
+    return lower, _strip_diacritics(lower)
+
+
+@lru_cache(maxsize=8192)
+def _char_mask(text: str) -> int:
+    """Bitmask of the distinct characters in text (bit n set for code point n)."""
+    mask = 0
+    for char in set(text):
+        mask |= 1 << ord(char)
+    return mask
+
+
+def _char_similarity(text1: str, text2: str) -> Optional[float]:
+    """
+    Shared characters / total distinct characters (Jaccard over character sets).
+
+    Works on cached bitmasks so each comparison is an AND/OR plus popcount
+    instead of building and intersecting two sets. Returns None if either
+    string is empty.
+    """
+    mask1 = _char_mask(text1)
+    mask2 = _char_mask(text2)
+    if not mask1 or not mask2:
+        return None
+    return (mask1 & mask2).bit_count() / (mask1 | mask2).bit_count()
+
 
 class TrainingPairAnalyzer:
     """
@@ -85,14 +201,14 @@ class TrainingPairAnalyzer:
         original_doc = Document(original_path)
         redlined_doc = Document(redlined_path)
         
-        # Extract text paragraphs
-        original_paras = [p.text for p in original_doc.paragraphs if p.text.strip()]
-        redlined_paras = [p.text for p in redlined_doc.paragraphs if p.text.strip()]
-        
-        # Also extract formatting information
+        # Extract formatting information (one walk over each document's paragraphs)
         original_formatted = self._extract_formatted_content(original_doc)
         redlined_formatted = self._extract_formatted_content(redlined_doc)
         
+        # Text paragraphs come from the same pass - it already skips blank ones
+        original_paras = [p['text'] for p in original_formatted]
+        redlined_paras = [p['text'] for p in redlined_formatted]
+        
         pair_analysis = {
             'original_path': original_path,
             'redlined_path': redlined_path,
@@ -100,6 +216,12 @@ class TrainingPairAnalyzer:
             'text_corrections': [],
             'formatting_corrections': [],
             'tracked_changes': [],
+            # Parsed approved-document paragraphs, so callers (e.g. the dish
+            # catalog) don't have to open the redlined file again
+            'redlined_paragraphs': [
+                {'text': p['text'], 'alignment': p['alignment']}
+                for p in redlined_formatted
+            ],
             'metadata': {
                 'original_paras': len(original_paras),
                 'redlined_paras': len(redlined_paras)
@@ -151,19 +273,15 @@ class TrainingPairAnalyzer:
         if not original or not corrected:
             return True  # Can't determine, let it through
         
-        orig_lower = original.lower().strip()
-        corr_lower = corrected.lower().strip()
+        orig_lower, orig_base = _folded_forms(original)
+        corr_lower, corr_base = _folded_forms(corrected)
         
         # 1. Spacing fix: removing/adding spaces
         if orig_lower.replace(' ', '') == corr_lower.replace(' ', ''):
             return True
         
         # 2. Diacritic addition: same base letters
-        import unicodedata
-        def remove_diacritics(s):
-            return ''.join(c for c in unicodedata.normalize('NFD', s) 
-                          if unicodedata.category(c) != 'Mn')
-        if remove_diacritics(orig_lower) == remove_diacritics(corr_lower):
+        if orig_base == corr_base:
             return True
         
         # 3. Abbreviation expansion: original is much shorter and starts similarly
@@ -182,15 +300,10 @@ class TrainingPairAnalyzer:
         
         # 5. High character similarity (edit distance)
         # Using simple ratio: shared characters / total characters
-        orig_set = set(orig_lower.replace(' ', ''))
-        corr_set = set(corr_lower.replace(' ', ''))
-        if orig_set and corr_set:
-            shared = len(orig_set & corr_set)
-            total = len(orig_set | corr_set)
-            similarity = shared / total
-            # If more than 60% character overlap, likely a correction
-            if similarity > 0.6:
-                return True
+        similarity = _char_similarity(orig_lower.replace(' ', ''), corr_lower.replace(' ', ''))
+        # If more than 60% character overlap, likely a correction
+        if similarity is not None and similarity > 0.6:
+            return True
         
         # 6. One contains the other (partial match)
         if orig_lower in corr_lower or corr_lower in orig_lower:
@@ -244,15 +357,48 @@ class TrainingPairAnalyzer:
         highlighted = set()
         
         for para_info in formatted_content:
-            for run in para_info.get('runs', []):
-                highlight = run.get('highlight')
-                if highlight and highlight != 'None' and 'YELLOW' in str(highlight).upper():
-                    text = run.get('text', '').strip().lower()
+            runs = para_info['runs']
+            for run_text, is_highlighted in zip(runs['text'], runs['highlight_yellow']):
+                if is_highlighted:
+                    text = run_text.strip().lower()
                     if text:
                         highlighted.add(text)
         
         return highlighted
     
+    @staticmethod
+    def _is_yellow_highlight(highlight) -> bool:
+        """Return True if a python-docx highlight color is yellow."""
+        return bool(highlight) and 'YELLOW' in str(highlight).upper()
+    
+    def _build_tracked_correction(
+        self,
+        para_text: str,
+        deleted_text: str,
+        added_text: str,
+        category: str
+    ) -> Dict:
+        """Build a correction record for a tracked change found in a paragraph."""
+        # Capture paragraph context (contains dish name)
+        dish_name = self._extract_dish_name_from_para(para_text)
+        
+        return {
+            'type': 'replacement' if added_text else 'deletion',
+            'original': deleted_text,
+            'corrected': added_text,
+            'category': category,
+            'source': 'tracked_changes',
+            'context': {
+                'paragraph': para_text[:100],  # First 100 chars for context
+                'dish_name': dish_name,
+            },
+            'word_diffs': [{
+                'operation': 'replace' if added_text else 'delete',
+                'original_words': deleted_text,
+                'corrected_words': added_text
+            }]
+        }
+    
     def _extract_tracked_changes(self, formatted_content: List[Dict], original_highlighted_text: set = None) -> List[Dict]:
         """
         Extract corrections from tracked changes in a redlined document.
@@ -275,47 +421,45 @@ class TrainingPairAnalyzer:
         original_highlighted_text = original_highlighted_text or set()
         
         for para_info in formatted_content:
-            runs = para_info.get('runs', [])
-            if not runs:
+            runs = para_info['runs']
+            run_count = len(runs['text'])
+            if not run_count:
                 continue
             
+            # Runs are stored column-wise, so the scan below is plain index
+            # lookups into the stripped texts and the two formatting flags
+            texts = [text.strip() for text in runs['text']]
+            highlighted = runs['highlight_yellow']
+            struck = runs['strike']
+            
             # Track which runs we've already processed
             processed = set()
             
             # First pass: find highlight + strikethrough pairs
-            for i, run in enumerate(runs):
+            for i in range(run_count):
                 if i in processed:
                     continue
                     
-                run_text = run.get('text', '').strip()
+                run_text = texts[i]
                 if not run_text:
                     continue
                 
-                highlight = run.get('highlight')
-                is_highlighted = highlight and highlight != 'None' and 'YELLOW' in str(highlight).upper()
-                is_strikethrough = run.get('strike')
-                
                 # Pattern 1: Highlighted text followed by strikethrough (replacement: new → old)
-                if is_highlighted:
+                if highlighted[i]:
                     added_text = run_text
                     deleted_text = ''
                     
                     # Look for following strikethrough
-                    for j in range(i + 1, min(i + 4, len(runs))):  # Check next few runs
-                        if j in processed:
-                            continue
-                        next_run = runs[j]
-                        next_text = next_run.get('text', '').strip()
-                        
-                        if not next_text:
+                    for j in range(i + 1, min(i + 4, run_count)):  # Check next few runs
+                        if j in processed or not texts[j]:
                             continue
                         
-                        if next_run.get('strike'):
-                            deleted_text = next_text
+                        if struck[j]:
+                            deleted_text = texts[j]
                             processed.add(j)
                             break
                         # Stop if we hit regular text
-                        elif not (next_run.get('highlight') and 'YELLOW' in str(next_run.get('highlight', '')).upper()):
+                        elif not highlighted[j]:
                             break
                     
                     if deleted_text:
@@ -332,128 +476,97 @@ class TrainingPairAnalyzer:
                         
                         # This is a replacement: old text was deleted, new text was added
                         category = self._categorize_correction(deleted_text, added_text)
-                        
-                        # Capture paragraph context (contains dish name)
-                        para_text = para_info.get('text', '')
-                        dish_name = self._extract_dish_name_from_para(para_text)
-                        
-                        correction = {
-                            'type': 'replacement',
-                            'original': deleted_text,
-                            'corrected': added_text,
-                            'category': category,
-                            'source': 'tracked_changes',
-                            'context': {
-                                'paragraph': para_text[:100],  # First 100 chars for context
-                                'dish_name': dish_name,
-                            },
-                            'word_diffs': [{
-                                'operation': 'replace',
-                                'original_words': deleted_text,
-                                'corrected_words': added_text
-                            }]
-                        }
-                        corrections.append(correction)
+                        corrections.append(self._build_tracked_correction(
+                            para_info.get('text', ''), deleted_text, added_text, category
+                        ))
                         processed.add(i)
-                        print(f"    Found tracked change: '{deleted_text}' → '{added_text}'")
+                        logger.debug("    Found tracked change: '%s' → '%s'", deleted_text, added_text)
                 
                 # Pattern 2: Strikethrough text followed by highlighted (replacement: old → new)
-                elif is_strikethrough:
+                elif struck[i]:
                     deleted_text = run_text
                     added_text = ''
                     
                     # Look for following highlighted text
-                    for j in range(i + 1, min(i + 4, len(runs))):
-                        if j in processed:
-                            continue
-                        next_run = runs[j]
-                        next_text = next_run.get('text', '').strip()
-                        
-                        if not next_text:
+                    for j in range(i + 1, min(i + 4, run_count)):
+                        if j in processed or not texts[j]:
                             continue
                         
-                        next_highlight = next_run.get('highlight')
-                        if next_highlight and next_highlight != 'None' and 'YELLOW' in str(next_highlight).upper():
-                            added_text = next_text
+                        if highlighted[j]:
+                            added_text = texts[j]
                             processed.add(j)
                             break
                         # Stop if we hit regular non-strikethrough text
-                        elif not next_run.get('strike'):
+                        elif not struck[j]:
                             break
                     
-                    if i not in processed:  # Not already processed as part of a highlight pair
-                        # Skip price changes
-                        if self._is_price_change(deleted_text, added_text):
-                            processed.add(i)
-                            continue
-                        
-                        # Skip if the "new" text was already highlighted in the original
-                        if added_text and added_text.lower() in original_highlighted_text:
-                            processed.add(i)
-                            continue
-                        
-                        if added_text:
-                            category = self._categorize_correction(deleted_text, added_text)
-                        else:
-                            category = 'deletion'
-                        
-                        # Capture paragraph context (contains dish name)
-                        para_text = para_info.get('text', '')
-                        dish_name = self._extract_dish_name_from_para(para_text)
-                        
-                        correction = {
-                            'type': 'replacement' if added_text else 'deletion',
-                            'original': deleted_text,
-                            'corrected': added_text,
-                            'category': category,
-                            'source': 'tracked_changes',
-                            'context': {
-                                'paragraph': para_text[:100],
-                                'dish_name': dish_name,
-                            },
-                            'word_diffs': [{
-                                'operation': 'replace' if added_text else 'delete',
-                                'original_words': deleted_text,
-                                'corrected_words': added_text
-                            }]
-                        }
-                        corrections.append(correction)
+                    # Skip price changes
+                    if self._is_price_change(deleted_text, added_text):
                         processed.add(i)
-                        print(f"    Found tracked change: '{deleted_text}' → '{added_text}'")
+                        continue
+                    
+                    # Skip if the "new" text was already highlighted in the original
+                    if added_text and added_text.lower() in original_highlighted_text:
+                        processed.add(i)
+                        continue
+                    
+                    if added_text:
+                        category = self._categorize_correction(deleted_text, added_text)
+                    else:
+                        category = 'deletion'
+                    
+                    corrections.append(self._build_tracked_correction(
+                        para_info.get('text', ''), deleted_text, added_text, category
+                    ))
+                    processed.add(i)
+                    logger.debug("    Found tracked change: '%s' → '%s'", deleted_text, added_text)
         
         return corrections
     
     def _extract_formatted_content(self, doc: Document) -> List[Dict]:
         """
         Extract text content with formatting information.
+        
+        Each paragraph's runs are stored column-wise: ``para_info['runs']`` is a
+        dict of parallel lists (text, highlight_yellow, strike, bold, ...) all
+        indexed by run position, rather than one dict per run.
         """
         formatted_content = []
         
         for para in doc.paragraphs:
-            if not para.text.strip():
+            para_text = _canonical_text(para.text)
+            if not para_text.strip():
                 continue
-                
-            para_info = {
-                'text': para.text,
-                'alignment': str(para.alignment),
-                'runs': []
+            
+            runs = {
+                'text': [],
+                'highlight_yellow': [],
+                'strike': [],
+                'bold': [],
+                'italic': [],
+                'underline': [],
+                'font_name': [],
+                'font_size': [],
+                'color': [],
             }
             
             for run in para.runs:
-                run_info = {
-                    'text': run.text,
-                    'bold': run.bold,
-                    'italic': run.italic,
-                    'underline': run.underline,
-                    'font_name': run.font.name,
-                    'font_size': run.font.size.pt if run.font.size else None,
-                    'strike': run.font.strike,
-                    'highlight': str(run.font.highlight_color) if run.font.highlight_color else None,
-                    'color': str(run.font.color.rgb) if run.font.color.rgb else None
-                }
-                para_info['runs'].append(run_info)
+                font = run.font
+                runs['text'].append(_canonical_text(run.text))
+                runs['highlight_yellow'].append(self._is_yellow_highlight(font.highlight_color))
+                runs['strike'].append(bool(font.strike))
+                runs['bold'].append(run.bold)
+                runs['italic'].append(run.italic)
+                runs['underline'].append(run.underline)
+                runs['font_name'].append(font.name)
+                runs['font_size'].append(font.size.pt if font.size else None)
+                runs['color'].append(str(font.color.rgb) if font.color.rgb else None)
             
-            formatted_content.append(para_info)
+            formatted_content.append({
+                'text': para_text,
+                'alignment': str(para.alignment),
+                'runs': runs
+            })
         
         return formatted_content
     
@@ -559,8 +672,8 @@ class TrainingPairAnalyzer:
             return False
         
         # Get words (ignore case and punctuation)
-        orig_words = set(re.sub(r'[^\w\s]', '', original.lower()).split())
-        corr_words = set(re.sub(r'[^\w\s]', '', corrected.lower()).split())
+        orig_words = set(_strip_punctuation(original.lower()).split())
+        corr_words = set(_strip_punctuation(corrected.lower()).split())
         
         # Remove common filler words
         filler = {'the', 'a', 'an', 'and', 'or', 'with', 'of', 'in', 'on', 'for'}
@@ -586,12 +699,14 @@ class TrainingPairAnalyzer:
         """
         Automatically categorize the type of correction.
         """
-        # Check for common patterns
-        orig_lower = original.lower().strip()
-        corr_lower = corrected.lower().strip()
+        # Check for common patterns - lowercase once and share it with the checks below
+        orig_lc = original.lower()
+        corr_lc = corrected.lower()
+        orig_lower = orig_lc.strip()
+        corr_lower = corr_lc.strip()
         
         # Allergen code correction (check FIRST - these look like spelling but aren't)
-        if self._is_allergen_correction(original, corrected):
+        if self._is_allergen_code_change(orig_lower, corr_lower):
             return 'allergen'
         
         # Terminology/word preference (check BEFORE spelling)
@@ -604,7 +719,7 @@ class TrainingPairAnalyzer:
             return 'spelling'
         
         # Case change
-        if original.lower() == corrected.lower():
+        if orig_lc == corr_lc:
             return 'case_change'
         
         # Punctuation/separator change
@@ -660,16 +775,11 @@ class TrainingPairAnalyzer:
         # but both are real words = likely terminology preference
         if len(original.split()) == 1 and len(corrected.split()) == 1:
             # Calculate character similarity
-            orig_set = set(original)
-            corr_set = set(corrected)
-            if orig_set and corr_set:
-                shared = len(orig_set & corr_set)
-                total = len(orig_set | corr_set)
-                similarity = shared / total
-                
-                # Low similarity + both short = different words, not typo
-                if similarity < 0.4 and len(original) <= 6 and len(corrected) <= 6:
-                    return True
+            similarity = _char_similarity(original, corrected)
+            
+            # Low similarity + both short = different words, not typo
+            if similarity is not None and similarity < 0.4 and len(original) <= 6 and len(corrected) <= 6:
+                return True
         
         return False
     
@@ -695,17 +805,12 @@ class TrainingPairAnalyzer:
         - "s" → "s*" (adding asterisk for raw/undercooked)
         - "v" → "d,v" (missing dairy marker)
         """
-        # Valid allergen codes (single letters and two-letter codes)
-        allergen_codes = {'d', 'n', 'g', 'v', 's', 'e', 'f', 'c', 'm', 'se', 'sy', 's*'}
-        
-        # Pattern for allergen strings: comma-separated codes, possibly with asterisks
-        allergen_pattern = r'^[a-z,\*]+$'
-        
-        orig_clean = original.lower().strip()
-        corr_clean = corrected.lower().strip()
-        
+        return self._is_allergen_code_change(_folded_forms(original)[0], _folded_forms(corrected)[0])
+    
+    def _is_allergen_code_change(self, orig_clean: str, corr_clean: str) -> bool:
+        """_is_allergen_correction for text that is already lowercased and stripped."""
         # Check if both strings look like allergen codes
-        if re.match(allergen_pattern, orig_clean) and re.match(allergen_pattern, corr_clean):
+        if _ALLERGEN_CODES_RE.match(orig_clean) and _ALLERGEN_CODES_RE.match(corr_clean):
             # Split by comma and check if they're valid codes
             orig_codes = set(orig_clean.replace('*', '').split(','))
             corr_codes = set(corr_clean.replace('*', '').split(','))
@@ -716,14 +821,14 @@ class TrainingPairAnalyzer:
             
             # If most codes are valid allergen codes, it's an allergen correction
             all_codes = orig_codes | corr_codes
-            valid_count = sum(1 for code in all_codes if code in allergen_codes)
+            valid_count = sum(1 for code in all_codes if code in _ALLERGEN_CODES)
             
             if valid_count >= len(all_codes) * 0.5:  # At least half are valid codes
                 return True
         
         # Also check for single letter changes that are allergen codes
         if len(orig_clean) <= 3 and len(corr_clean) <= 3:
-            if orig_clean in allergen_codes or corr_clean in allergen_codes:
+            if orig_clean in _ALLERGEN_CODES or corr_clean in _ALLERGEN_CODES:
                 return True
         
         return False
@@ -735,7 +840,13 @@ class TrainingPairAnalyzer:
             return False
         
         orig_words = set(original.lower().split())
-        corr_words = set(corrected.lower().split())
+        corr_split = corrected.lower().split()
+        
+        # Fewer words than the original has distinct words - the word sets
+        # can't be the same size, so skip building the second one
+        if len(corr_split) < len(orig_words):
+            return False
+        corr_words = set(corr_split)
         
         # Check for word substitutions that might be spelling
         if len(orig_words) == len(corr_words):
@@ -748,23 +859,14 @@ class TrainingPairAnalyzer:
     def _is_punctuation_change(self, original: str, corrected: str) -> bool:
         """Check if this is primarily a punctuation change."""
         # Remove all punctuation and compare
-        orig_clean = re.sub(r'[^\w\s]', '', original)
-        corr_clean = re.sub(r'[^\w\s]', '', corrected)
+        orig_clean = _strip_punctuation(original)
+        corr_clean = _strip_punctuation(corrected)
         
         return orig_clean == corr_clean
     
     def _is_diacritic_change(self, original: str, corrected: str) -> bool:
         """Check if diacritics were added/changed."""
-        import unicodedata
-        
-        # Normalize to remove diacritics
-        orig_norm = unicodedata.normalize('NFD', original)
-        orig_base = ''.join(c for c in orig_norm if unicodedata.category(c) != 'Mn')
-        
-        corr_norm = unicodedata.normalize('NFD', corrected)
-        corr_base = ''.join(c for c in corr_norm if unicodedata.category(c) != 'Mn')
-        
-        return orig_base.lower() == corr_base.lower()
+        return _strip_diacritics(original).lower() == _strip_diacritics(corrected).lower()
     
     def _get_word_level_diffs(self, original: str, corrected: str) -> List[Dict]:
         """
@@ -773,6 +875,24 @@ class TrainingPairAnalyzer:
         orig_words = original.split()
         corr_words = corrected.split()
         
+        if orig_words == corr_words:
+            return []
+        
+        # No word in common (e.g. a single-word swap): there is nothing for the
+        # matcher to align, so it would report the whole span as one change
+        if set(orig_words).isdisjoint(corr_words):
+            if orig_words and corr_words:
+                operation = 'replace'
+            elif orig_words:
+                operation = 'delete'
+            else:
+                operation = 'insert'
+            return [{
+                'operation': operation,
+                'original_words': ' '.join(orig_words),
+                'corrected_words': ' '.join(corr_words)
+            }]
+        
         matcher = difflib.SequenceMatcher(None, orig_words, corr_words)
         diffs = []
         
@@ -806,14 +926,14 @@ class TrainingPairAnalyzer:
         if ', ' in text:
             dish_name = text.split(', ')[0].strip()
             # Clean up any leading formatting markers
-            dish_name = re.sub(r'^[\d\.\)\-\s]+', '', dish_name)
+            dish_name = _LEAD_FMT_RE.sub('', dish_name)
             if dish_name and len(dish_name) > 1:
                 return dish_name
         
         # Try dash-separated format
         if ' - ' in text:
             dish_name = text.split(' - ')[0].strip()
-            dish_name = re.sub(r'^[\d\.\)\-\s]+', '', dish_name)
+            dish_name = _LEAD_FMT_RE.sub('', dish_name)
             if dish_name and len(dish_name) > 1:
                 return dish_name
         
@@ -845,24 +965,48 @@ class TrainingPairAnalyzer:
         """
         format_corrections = []
         
+        # Block by length: ratio() > 0.8 needs the shorter text to be more
+        # than 2/3 the length of the longer, so each original paragraph only
+        # has to be compared against a window of the length-sorted redlined
+        # paragraphs.
+        by_length = sorted(range(len(redlined)), key=lambda i: len(redlined[i]['text']))
+        lengths = [len(redlined[i]['text']) for i in by_length]
+        
+        # One matcher per redlined paragraph, built on first use: SequenceMatcher
+        # indexes its second sequence once, so only the original side changes.
+        matchers = {}
+        
         # Compare formatting for similar paragraphs
         for orig_para in original:
-            for redl_para in redlined:
-                # If text is similar, check formatting
-                if self._text_similarity(orig_para['text'], redl_para['text']) > 0.8:
-                    if orig_para['alignment'] != redl_para['alignment']:
-                        format_corrections.append({
-                            'type': 'alignment',
-                            'text': orig_para['text'][:50],
-                            'original': orig_para['alignment'],
-                            'corrected': redl_para['alignment']
-                        })
+            text_len = len(orig_para['text'])
+            lo = bisect.bisect_left(lengths, (2 * text_len) // 3)
+            hi = bisect.bisect_right(lengths, (3 * text_len) // 2 + 1)
+            
+            # Visit the window in document order so results keep their order
+            for redl_idx in sorted(by_length[lo:hi]):
+                redl_para = redlined[redl_idx]
+                # Same alignment can never produce a correction - skip the
+                # similarity check entirely
+                if orig_para['alignment'] == redl_para['alignment']:
+                    continue
+                matcher = matchers.get(redl_idx)
+                if matcher is None:
+                    matcher = difflib.SequenceMatcher(None, '', redl_para['text'])
+                    matchers[redl_idx] = matcher
+                # If text is similar, check formatting. real_quick_ratio() and
+                # quick_ratio() are cheap upper bounds on ratio().
+                matcher.set_seq1(orig_para['text'])
+                if (matcher.real_quick_ratio() > 0.8
+                        and matcher.quick_ratio() > 0.8
+                        and matcher.ratio() > 0.8):
+                    format_corrections.append({
+                        'type': 'alignment',
+                        'text': orig_para['text'][:50],
+                        'original': orig_para['alignment'],
+                        'corrected': redl_para['alignment']
+                    })
         
         return format_corrections
-    
-    def _text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity ratio between two texts."""
-        return difflib.SequenceMatcher(None, text1, text2).ratio()
 
 
 class RuleGenerator:
@@ -897,19 +1041,15 @@ class RuleGenerator:
         if not original or not corrected:
             return True  # Can't determine, let it through
         
-        orig_lower = original.lower().strip()
-        corr_lower = corrected.lower().strip()
+        orig_lower, orig_base = _folded_forms(original)
+        corr_lower, corr_base = _folded_forms(corrected)
         
         # 1. Spacing fix: removing/adding spaces
         if orig_lower.replace(' ', '') == corr_lower.replace(' ', ''):
             return True
         
         # 2. Diacritic addition: same base letters
-        import unicodedata
-        def remove_diacritics(s):
-            return ''.join(c for c in unicodedata.normalize('NFD', s) 
-                          if unicodedata.category(c) != 'Mn')
-        if remove_diacritics(orig_lower) == remove_diacritics(corr_lower):
+        if orig_base == corr_base:
             return True
         
         # 3. Abbreviation expansion: original is short, corrected is longer
@@ -926,13 +1066,9 @@ class RuleGenerator:
             return True
         
         # 5. High character similarity
-        orig_set = set(orig_lower.replace(' ', ''))
-        corr_set = set(corr_lower.replace(' ', ''))
-        if orig_set and corr_set:
-            shared = len(orig_set & corr_set)
-            total = len(orig_set | corr_set)
-            if shared / total > 0.6:
-                return True
+        similarity = _char_similarity(orig_lower.replace(' ', ''), corr_lower.replace(' ', ''))
+        if similarity is not None and similarity > 0.6:
+            return True
         
         # 6. One contains the other
         if orig_lower in corr_lower or corr_lower in orig_lower:
@@ -948,7 +1084,8 @@ class RuleGenerator:
         self, 
         corrections: List[Dict],
         min_occurrences: int = 2,
-        existing_rules: List[Dict] = None
+        existing_rules: List[Dict] = None,
+        existing_patterns: set = None
     ) -> List[Dict]:
         """
         Generate rules from a list of corrections.
@@ -957,6 +1094,8 @@ class RuleGenerator:
             corrections: List of correction dictionaries
             min_occurrences: Minimum times a pattern must appear to become a rule
             existing_rules: Optional list of existing rules to avoid duplicates
+            existing_patterns: Optional prebuilt set of (original, corrected)
+                patterns to skip - used instead of existing_rules when given
             
         Returns:
             List of generated rules (only NEW rules, not duplicates)
@@ -965,13 +1104,8 @@ class RuleGenerator:
         skip_categories = {'swapped_item', 'content_removal', 'content_addition'}
         
         # Build set of existing patterns to avoid duplicates
-        existing_patterns = set()
-        if existing_rules:
-            for rule in existing_rules:
-                if rule.get('rule_id', '').startswith('LEARNED'):
-                    orig = rule.get('details', {}).get('original_text', '').lower()
-                    corr = rule.get('details', {}).get('corrected_text', '').lower()
-                    existing_patterns.add((orig, corr))
+        if existing_patterns is None:
+            existing_patterns = self.patterns_from_rules(existing_rules or [])
         
         # Group corrections by category
         by_category = defaultdict(list)
@@ -1020,6 +1154,15 @@ class RuleGenerator:
         
         return generated_rules
     
+    def patterns_from_rules(self, rules: List[Dict]) -> set:
+        """Set of (original, corrected) patterns covered by the learned rules in rules."""
+        return {
+            (rule.get('details', {}).get('original_text', '').lower(),
+             rule.get('details', {}).get('corrected_text', '').lower())
+            for rule in rules
+            if rule.get('rule_id', '').startswith('LEARNED')
+        }
+    
     def _find_patterns(self, corrections: List[Dict]) -> Tuple[Dict[Tuple[str, str], int], Dict[Tuple[str, str], List[Dict]]]:
         """
         Find recurring patterns in corrections.
@@ -1029,24 +1172,22 @@ class RuleGenerator:
             - pattern_count: Dict mapping pattern to occurrence count
             - pattern_contexts: Dict mapping pattern to list of context dicts
         """
-        pattern_count = Counter()
-        pattern_contexts = defaultdict(list)
+        # Word-level replacements paired with the context they came from
+        occurrences = [
+            ((word_diff['original_words'].lower(), word_diff['corrected_words'].lower()),
+             corr.get('context', {}))
+            for corr in corrections
+            for word_diff in corr.get('word_diffs', [])
+            if word_diff['operation'] == 'replace'
+        ]
         
-        for corr in corrections:
-            # Get context info
-            context = corr.get('context', {})
-            
-            # Extract word-level changes
-            for word_diff in corr.get('word_diffs', []):
-                if word_diff['operation'] == 'replace':
-                    orig = word_diff['original_words'].lower()
-                    corr_text = word_diff['corrected_words'].lower()
-                    
-                    # Store the pattern and its context
-                    pattern = (orig, corr_text)
-                    pattern_count[pattern] += 1
-                    if context:
-                        pattern_contexts[pattern].append(context)
+        # Count in one go - Counter's constructor tallies in C
+        pattern_count = Counter(pattern for pattern, _ in occurrences)
+        
+        pattern_contexts = defaultdict(list)
+        for pattern, context in occurrences:
+            if context:
+                pattern_contexts[pattern].append(context)
         
         return pattern_count, pattern_contexts
     
@@ -1074,13 +1215,17 @@ class RuleGenerator:
         for ctx in contexts:
             if ctx.get('dish_name'):
                 dish_names.append(ctx['dish_name'])
-        dish_names = list(set(dish_names))  # Unique names
+        dish_names = list(dict.fromkeys(dish_names))  # Unique names, first-seen order
         
         # Get context hints if available (from known_corrections.py)
         hints = get_context_hints(original, corrected) if KNOWN_CORRECTIONS_AVAILABLE else {}
         
+        # Stable across runs - hash() of a str is salted per process
+        digest = hashlib.blake2b(f'{original}\x00{corrected}'.encode('utf-8'), digest_size=4).digest()
+        rule_number = int.from_bytes(digest, 'big') % 10000
+        
         rule = {
-            'rule_id': f'LEARNED-{category.upper()}-{abs(hash(pattern)) % 10000:04d}',
+            'rule_id': f'LEARNED-{category.upper()}-{rule_number:04d}',
             'category': category.replace('_', ' ').title(),
             'severity': 'Medium',
             'description': self.rule_templates.get(category, 'Fix: "{original}" → "{corrected}"').format(
@@ -1183,6 +1328,7 @@ class TrainingPipeline:
         
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.session_file = self.training_data_dir / f"session_{self.session_id}.json"
+        self.patterns_cache_file = self.training_data_dir / "existing_patterns_cache.json"
         
         self.session_data = {
             'session_id': self.session_id,
@@ -1192,6 +1338,7 @@ class TrainingPipeline:
             'approved_dishes_stored': 0,
             'pairs': [],
             'all_corrections': [],
+            'category_counts': Counter(),
             'generated_rules': []
         }
     
@@ -1220,85 +1367,90 @@ class TrainingPipeline:
         
         # Store all corrections
         self.session_data['all_corrections'].extend(analysis['text_corrections'])
+        self.session_data['category_counts'].update(
+            c.get('category', 'unknown') for c in analysis['text_corrections'])
         
         # Store corrections in dish database (both allergens AND full descriptions)
         if DISH_DB_AVAILABLE:
-            restaurant = extract_restaurant(original_path)
-            dishes_stored = 0
-            
-            for correction in analysis['text_corrections']:
-                category = correction.get('category', '')
+            # One database write for the whole pair instead of one per dish
+            with dish_db_batch():
+                restaurant = extract_restaurant(original_path)
+                dishes_stored = 0
                 
-                # Skip swapped items - these are not real corrections
-                if category == 'swapped_item':
-                    continue
-                
-                original_line = correction.get('original', '')
-                corrected_line = correction.get('corrected', '')
-                
-                # Store allergen corrections
-                if category == 'allergen':
-                    for word_diff in correction.get('word_diffs', []):
-                        orig_codes = word_diff.get('original_words', '')
-                        corr_codes = word_diff.get('corrected_words', '')
-                        
-                        result = store_allergen_correction(
-                            dish_line=original_line,
-                            original_codes=orig_codes,
-                            corrected_codes=corr_codes,
-                            restaurant=restaurant
-                        )
-                        if result:
-                            dishes_stored += 1
-                
-                # Store COMPLETE dish descriptions for spelling/general corrections
-                # This captures ingredient changes like "pork chorizo" → "bacon"
-                elif category in ('spelling', 'general', 'diacritics'):
-                    # Only store if it looks like a menu item (has commas = has ingredients)
-                    if ', ' in corrected_line and len(corrected_line) > 20:
-                        result = learn_dish_from_correction(
-                            original_line=original_line,
-                            corrected_line=corrected_line,
-                            restaurant=restaurant
-                        )
-                        if result:
-                            dishes_stored += 1
-                
-                # Store terminology corrections with dish context
-                # So next time we see "Red Paloma", we know "crust" → "rim"
-                elif category == 'terminology':
-                    context = correction.get('context', {})
-                    dish_name = context.get('dish_name')
+                for correction in analysis['text_corrections']:
+                    category = correction.get('category', '')
+                    
+                    # Skip swapped items - these are not real corrections
+                    if category == 'swapped_item':
+                        continue
+                    
+                    original_line = correction.get('original', '')
+                    corrected_line = correction.get('corrected', '')
                     
-                    if dish_name:
+                    # Store allergen corrections
+                    if category == 'allergen':
                         for word_diff in correction.get('word_diffs', []):
-                            orig_term = word_diff.get('original_words', '')
-                            corr_term = word_diff.get('corrected_words', '')
+                            orig_codes = word_diff.get('original_words', '')
+                            corr_codes = word_diff.get('corrected_words', '')
                             
-                            if orig_term and corr_term:
-                                result = store_dish_terminology_correction(
-                                    dish_name=dish_name,
-                                    original_term=orig_term,
-                                    corrected_term=corr_term,
-                                    restaurant=restaurant,
-                                    context_paragraph=context.get('paragraph')
-                                )
-                                if result:
-                                    dishes_stored += 1
-                                    print(f"    Stored terminology '{orig_term}' → '{corr_term}' for dish: {dish_name}")
-            
-            if dishes_stored > 0:
-                print(f"  Stored {dishes_stored} corrections to dish database")
-            
-            # NEW: Store ALL dishes from the approved (redlined) document
-            # This builds the master catalog of approved dishes
-            approved_dishes_stored = self._store_all_approved_dishes(
-                redlined_path, 
-                restaurant
-            )
-            if approved_dishes_stored > 0:
-                print(f"  Stored {approved_dishes_stored} approved dishes to master catalog")
-                self.session_data['approved_dishes_stored'] += approved_dishes_stored
+                            result = store_allergen_correction(
+                                dish_line=original_line,
+                                original_codes=orig_codes,
+                                corrected_codes=corr_codes,
+                                restaurant=restaurant
+                            )
+                            if result:
+                                dishes_stored += 1
+                    
+                    # Store COMPLETE dish descriptions for spelling/general corrections
+                    # This captures ingredient changes like "pork chorizo" → "bacon"
+                    elif category in ('spelling', 'general', 'diacritics'):
+                        # Only store if it looks like a menu item (has commas = has ingredients)
+                        if ', ' in corrected_line and len(corrected_line) > 20:
+                            result = learn_dish_from_correction(
+                                original_line=original_line,
+                                corrected_line=corrected_line,
+                                restaurant=restaurant
+                            )
+                            if result:
+                                dishes_stored += 1
+                    
+                    # Store terminology corrections with dish context
+                    # So next time we see "Red Paloma", we know "crust" → "rim"
+                    elif category == 'terminology':
+                        context = correction.get('context', {})
+                        dish_name = context.get('dish_name')
+                        
+                        if dish_name:
+                            for word_diff in correction.get('word_diffs', []):
+                                orig_term = word_diff.get('original_words', '')
+                                corr_term = word_diff.get('corrected_words', '')
+                                
+                                if orig_term and corr_term:
+                                    result = store_dish_terminology_correction(
+                                        dish_name=dish_name,
+                                        original_term=orig_term,
+                                        corrected_term=corr_term,
+                                        restaurant=restaurant,
+                                        context_paragraph=context.get('paragraph')
+                                    )
+                                    if result:
+                                        dishes_stored += 1
+                                        print(f"    Stored terminology '{orig_term}' → '{corr_term}' for dish: {dish_name}")
+                
+                if dishes_stored > 0:
+                    print(f"  Stored {dishes_stored} corrections to dish database")
+                
+                # NEW: Store ALL dishes from the approved (redlined) document
+                # This builds the master catalog of approved dishes
+                approved_dishes_stored = self._store_all_approved_dishes(
+                    analysis['redlined_paragraphs'],
+                    redlined_path, 
+                    restaurant
+                )
+                if approved_dishes_stored > 0:
+                    print(f"  Stored {approved_dishes_stored} approved dishes to master catalog")
+                    self.session_data['approved_dishes_stored'] += approved_dishes_stored
         
         print(f"  Found {len(analysis['text_corrections'])} text corrections")
         print(f"  Found {len(analysis['formatting_corrections'])} formatting corrections")
@@ -1307,6 +1459,7 @@ class TrainingPipeline:
     
     def _store_all_approved_dishes(
         self, 
+        redlined_paragraphs: List[Dict],
         redlined_path: str, 
         restaurant: str
     ) -> int:
@@ -1323,7 +1476,9 @@ class TrainingPipeline:
         - Menu type
         
         Args:
-            redlined_path: Path to the approved document
+            redlined_paragraphs: Paragraphs of the approved document, as returned
+                in ``load_document_pair``'s ``redlined_paragraphs``
+            redlined_path: Path to the approved document (used for its filename)
             restaurant: Restaurant identifier
             
         Returns:
@@ -1332,16 +1487,14 @@ class TrainingPipeline:
         if not DISH_DB_AVAILABLE:
             return 0
         
-        doc = Document(redlined_path)
-        
         # Extract menu date and type from filename
         menu_date = extract_menu_date(redlined_path)
         menu_type = extract_menu_type(redlined_path)
         
         dishes_stored = 0
         
-        for para in doc.paragraphs:
-            text = para.text.strip()
+        for para in redlined_paragraphs:
+            text = para['text'].strip()
             
             # Skip empty lines
             if not text or len(text) < 5:
@@ -1354,22 +1507,19 @@ class TrainingPipeline:
             if text.isupper() and len(text.split()) <= 3:
                 continue
             
+            text_lower = text.lower()
+            
             # Skip warning text
-            if 'consuming raw' in text.lower() or 'foodborne' in text.lower():
+            if any(phrase in text_lower for phrase in _SKIP_PHRASES):
                 continue
             
             # Skip page numbers, template headers, etc.
-            if text.lower().startswith(('page', 'menu', 'restaurant', 'venue')):
+            if text_lower.startswith(_SKIP_PREFIXES):
                 continue
             
             # Only process lines that look like menu items
             # They typically have commas (ingredients) or a price at the end
-            has_comma = ', ' in text
-            has_price = bool(re.search(r'\s+\d+(?:\|\d+)?\s*$', text))
-            has_allergens = bool(re.search(r'\s+[A-Z,]+\s*$', text))
-            
-            # Must have at least one indicator of being a menu item
-            if not (has_comma or has_price or has_allergens):
+            if not _MENU_ITEM_RE.search(text):
                 continue
             
             # Store this dish
@@ -1401,7 +1551,15 @@ class TrainingPipeline:
         """
         dir_path = Path(directory)
         
-        original_files = sorted(dir_path.glob(original_pattern))
+        # List the directory once and match names in memory, rather than
+        # re-globbing the directory for every original file
+        with os.scandir(dir_path) as entries:
+            names = [entry.name for entry in entries]
+        redlined_names = [name for name in names if fnmatch.fnmatch(name, "*redlined*.docx")]
+        
+        original_files = sorted(
+            dir_path / name for name in names if fnmatch.fnmatch(name, original_pattern)
+        )
         
         print(f"\nScanning directory: {directory}")
         print(f"Found {len(original_files)} original files")
@@ -1411,7 +1569,11 @@ class TrainingPipeline:
             base_name = orig_file.stem.replace('original', '').replace('_', '').strip()
             
             # Look for redlined version
-            redlined_candidates = list(dir_path.glob(f"*{base_name}*redlined*.docx"))
+            redlined_pattern_for_base = f"*{base_name}*redlined*.docx"
+            redlined_candidates = [
+                dir_path / name for name in redlined_names
+                if fnmatch.fnmatch(name, redlined_pattern_for_base)
+            ]
             
             if not redlined_candidates:
                 print(f"\nWarning: No redlined version found for {orig_file.name}")
@@ -1446,22 +1608,19 @@ class TrainingPipeline:
             print(f"Filtered out {swapped_count} swapped menu items (not real corrections)")
         
         # Load existing rules to avoid duplicates
-        existing_rules = []
+        existing_patterns = set()
         if existing_rules_path and os.path.exists(existing_rules_path):
             try:
-                with open(existing_rules_path, 'r') as f:
-                    data = json.load(f)
-                    existing_rules = data.get('rules', [])
-                    existing_learned = [r for r in existing_rules if r.get('rule_id', '').startswith('LEARNED')]
-                    if existing_learned:
-                        print(f"Found {len(existing_learned)} existing learned rules (will skip duplicates)")
+                learned_count, existing_patterns = self._load_existing_patterns(existing_rules_path)
+                if learned_count:
+                    print(f"Found {learned_count} existing learned rules (will skip duplicates)")
             except Exception as e:
                 print(f"Note: Could not load existing rules: {e}")
         
         rules = self.rule_generator.generate_rules_from_corrections(
             valid_corrections,
             min_occurrences=min_occurrences,
-            existing_rules=existing_rules
+            existing_patterns=existing_patterns
         )
         
         self.session_data['generated_rules'] = rules
@@ -1471,6 +1630,54 @@ class TrainingPipeline:
         
         return rules
     
+    def _load_existing_patterns(self, existing_rules_path: str) -> Tuple[int, set]:
+        """
+        Load the (original, corrected) patterns of the learned rules in an
+        existing rules file.
+        
+        The result is cached in the training directory, keyed on the rules
+        file's path, size and mtime, so repeated runs against the same rules
+        file don't re-parse all of it.
+        
+        Returns:
+            Tuple of (number of learned rules, set of patterns)
+        """
+        stat = os.stat(existing_rules_path)
+        source = {
+            'path': os.path.abspath(existing_rules_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns
+        }
+        
+        try:
+            with open(self.patterns_cache_file, 'rb') as f:
+                cached = json.loads(f.read())
+            if cached.get('source') == source:
+                return cached['learned_rules'], {tuple(p) for p in cached['patterns']}
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # No usable cache - rebuild it from the rules file
+        
+        # Parse straight from bytes - skips the text-mode decode layer
+        with open(existing_rules_path, 'rb') as f:
+            data = json.loads(f.read())
+        existing_learned = [
+            r for r in data.get('rules', [])
+            if r.get('rule_id', '').startswith('LEARNED')
+        ]
+        patterns = self.rule_generator.patterns_from_rules(existing_learned)
+        
+        try:
+            with open(self.patterns_cache_file, 'w') as f:
+                json.dump({
+                    'source': source,
+                    'learned_rules': len(existing_learned),
+                    'patterns': sorted(patterns)
+                }, f)
+        except OSError as e:
+            print(f"Note: Could not cache existing rule patterns: {e}")
+        
+        return len(existing_learned), patterns
+    
     def save_rules_to_file(self, output_path: str = None):
         """
         Save generated rules to a JSON file.
@@ -1548,13 +1755,10 @@ class TrainingPipeline:
         print(f"Rules generated: {self.session_data['rules_generated']}")
         print(f"Approved dishes added to catalog: {self.session_data['approved_dishes_stored']}")
         
-        # Category breakdown
-        if self.session_data['all_corrections']:
-            categories = Counter(c.get('category', 'unknown') 
-                                for c in self.session_data['all_corrections'])
-            
+        # Category breakdown (counted as corrections are ingested)
+        if self.session_data['category_counts']:
             print("\nCorrections by category:")
-            for category, count in categories.most_common():
+            for category, count in self.session_data['category_counts'].most_common():
                 print(f"  {category}: {count}")
         
         # Dish allergen database stats
@@ -1611,6 +1815,11 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    logging.basicConfig(
+        format='%(message)s',
+        level=logging.DEBUG if os.getenv('TRAINING_PIPELINE_DEBUG') else logging.INFO
+    )
+    
     # Initialize pipeline
     pipeline = TrainingPipeline()
     
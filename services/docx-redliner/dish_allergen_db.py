@@ -22,8 +22,14 @@ Each dish entry includes:
 - confidence: 0-1 score (increases with more corrections)
 """
 
+import hashlib
+import heapq
 import json
 import os
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -74,9 +80,61 @@ INGREDIENT_ALLERGENS = {
     'mustard': 'M', 'dijon': 'M',
 }
 
+# The same mapping grouped by allergen code, so inference can stop looking
+# at a code's ingredients as soon as one of them is found
+_INGREDIENTS_BY_CODE = {}
+for _ingredient, _code in INGREDIENT_ALLERGENS.items():
+    _INGREDIENTS_BY_CODE.setdefault(_code, []).append(_ingredient)
+del _ingredient, _code
+
 # Database path
 DB_PATH = Path(__file__).parent.parent.parent / 'data' / 'dish-allergens.json'
 
+# Restaurant name at the start of a filename, most specific pattern first
+_RESTAURANT_PATTERNS = [
+    re.compile(r'^([\w\s\']+?)[\s_-]*(menu|revision|brief|submission)', re.IGNORECASE),
+    re.compile(r'^([\w\s\']+?)[\s_-]*\d', re.IGNORECASE),
+    re.compile(r'^([\w\s\']+)', re.IGNORECASE),
+]
+_NON_WORD_RE = re.compile(r'[^\w]')
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
+# Trailing price on a menu line ("18", "18.50"), optionally captured
+_PRICE_TAIL_RE = re.compile(r'\s+(\d+(?:\.\d{2})?)\s*$')
+
+# Trailing allergen codes on a corrected line ("D,G", "*D,G")
+_ALLERGEN_TAIL_RE = re.compile(r'\s+\*?([DNGVSEFC,\*]+)\s*$', re.IGNORECASE)
+
+# Trailing allergen codes including any separator before them (", d,n")
+_CODES_TAIL_RE = re.compile(r'[,\s]*[DNGVSEFC,\*]+\s*$', re.IGNORECASE)
+
+# Menu dates in filenames (see extract_menu_date), tried in this order
+_HAS_DIGIT_RE = re.compile(r'\d')
+_MONTH = r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)'
+_DATE_D_MON_YYYY_RE = re.compile(r'(\d{1,2})[\.\s]?' + _MONTH + r'[a-z]*[\.\s]?(\d{4})')
+_DATE_MON_YYYY_RE = re.compile(_MONTH + r'[a-z]*[\.\s]+(\d{4})')
+_DATE_DDMMYYYY_RE = re.compile(r'(\d{2})(\d{2})(\d{4})')
+_DATE_MM_DD_YY_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{2})(?!\d)')
+_DATE_ISO_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+_MONTH_NUMBERS = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
+    'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12',
+}
+
+# Trailing parts of an approved menu line (see store_approved_dish)
+_LINE_PRICE_RE = re.compile(r'\s+(\d+(?:\|\d+)?)\s*$')
+_LINE_PAREN_ALLERGENS_RE = re.compile(r'\s*\(([A-Z,\s\*]+)\)\s*$')
+_LINE_ALLERGENS_RE = re.compile(r'\s+\*?([A-Z,\*]+)\s*$')
+
+# Phrases marking template/boilerplate lines rather than menu items
+_SKIP_LINE_PHRASES = (
+    'consuming raw', 'foodborne illness', 'allergen key',
+    'vegetarian', 'vegan', 'gluten free', 'dairy free',
+    'step 1', 'step 2', 'step 3', 'obtain', 'design request',
+    'page ', 'menu submission', 'restaurant name', 'venue',
+    'template', 'brief', 'guidelines', 'rsh design',
+)
+
 
 def _create_empty_database() -> Dict:
     """Create an empty database structure."""
@@ -92,15 +150,69 @@ def _create_empty_database() -> Dict:
     }
 
 
+# Parsed database, reused while the file on disk is unchanged. The file is
+# also written by the Node services, so staleness is checked via stat.
+_DB_CACHE = {'path': None, 'stamp': None, 'db': None, 'index': None, 'version': 0}
+
+# Last export_for_ai_prompt() text, valid for one database object + version
+_EXPORT_CACHE = {'db': None, 'version': None, 'text': None}
+
+# Batch mode (see batch()): while active, changes stay in memory
+_BATCH = {'depth': 0, 'dirty': False}
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 def load_database() -> Dict:
-    """Load the dish allergen database."""
+    """
+    Load the dish allergen database.
+    
+    The parsed JSON is cached in memory and only re-read when the file's
+    mtime/size change, so repeated lookups don't re-parse the whole file.
+    Callers get the cached dict itself - mutate it only to save it back.
+    """
+    # Unsaved batched changes take precedence over the file on disk
+    if _BATCH['dirty'] and _DB_CACHE['db'] is not None and _DB_CACHE['path'] == DB_PATH:
+        return _DB_CACHE['db']
+    
+    stamp = _file_stamp(DB_PATH)
+    if (stamp is not None and _DB_CACHE['db'] is not None
+            and _DB_CACHE['path'] == DB_PATH and _DB_CACHE['stamp'] == stamp):
+        return _DB_CACHE['db']
+    
     try:
         with open(DB_PATH, 'r') as f:
-            return json.load(f)
+            db = json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         db = _create_empty_database()
         save_database(db)
         return db
+    
+    # Other writers may not keep the counts current - recount once per load,
+    # after which they are maintained as entries are added
+    _rebuild_statistics(db)
+    
+    _DB_CACHE.update(path=DB_PATH, stamp=stamp, db=db)
+    return db
+
+
+def reload_database() -> Dict:
+    """
+    Drop the cached database and read it again from disk.
+    
+    Only needed when the file may have changed without its mtime/size
+    changing; any unsaved batched changes are discarded.
+    """
+    _DB_CACHE.update(path=None, stamp=None, db=None)
+    _BATCH['dirty'] = False
+    return load_database()
 
 
 def save_database(db: Dict) -> None:
@@ -108,79 +220,197 @@ def save_database(db: Dict) -> None:
     # Ensure directory exists
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     
-    # Update statistics
+    # by_restaurant/by_source are kept current by _add_entry
     db['statistics']['total_dishes'] = len(db['entries'])
-    db['statistics']['by_restaurant'] = {}
-    db['statistics']['by_source'] = {}
-    
-    for entry in db['entries']:
-        restaurant = entry.get('restaurant', 'unknown')
-        source = entry.get('source', 'unknown')
-        
-        db['statistics']['by_restaurant'][restaurant] = \
-            db['statistics']['by_restaurant'].get(restaurant, 0) + 1
-        db['statistics']['by_source'][source] = \
-            db['statistics']['by_source'].get(source, 0) + 1
+    _DB_CACHE['version'] += 1
     
     db['last_updated'] = datetime.now().isoformat()
     
-    with open(DB_PATH, 'w') as f:
+    # Write to a temp file and swap it in, so readers never see a partial file
+    tmp_path = DB_PATH.with_name(DB_PATH.name + '.tmp')
+    with open(tmp_path, 'w') as f:
         json.dump(db, f, indent=2)
+    os.replace(tmp_path, DB_PATH)
+    
+    # What we just wrote is what the next load would parse
+    _DB_CACHE.update(path=DB_PATH, stamp=_file_stamp(DB_PATH), db=db)
+
+
+@contextmanager
+def batch():
+    """
+    Group many database updates into a single write.
+    
+        with batch():
+            for line in approved_lines:
+                store_approved_dish(line, restaurant)
+    
+    Inside the block, upserts only change the in-memory database. It is saved
+    once when the outermost batch exits - also on error, so nothing learned
+    before the failure is lost.
+    """
+    _BATCH['depth'] += 1
+    try:
+        yield
+    finally:
+        _BATCH['depth'] -= 1
+        if _BATCH['depth'] == 0:
+            flush()
+
+
+def flush() -> None:
+    """Write pending batched changes to disk, if there are any."""
+    if _BATCH['dirty']:
+        save_database(_DB_CACHE['db'])
+        _BATCH['dirty'] = False
+
+
+def _commit(db: Dict) -> None:
+    """Save after an update - or, inside batch(), just mark it pending."""
+    _DB_CACHE['version'] += 1
+    if _BATCH['depth']:
+        _BATCH['dirty'] = True
+    else:
+        save_database(db)
+
+
+def _rebuild_statistics(db: Dict) -> None:
+    """Recount the per-restaurant and per-source statistics from the entries."""
+    entries = db['entries']
+    stats = db.setdefault('statistics', {})
+    stats['total_dishes'] = len(entries)
+    stats['by_restaurant'] = dict(Counter(e.get('restaurant', 'unknown') for e in entries))
+    stats['by_source'] = dict(Counter(e.get('source', 'unknown') for e in entries))
+
+
+def _add_entry(db: Dict, index: Dict, entry: Dict) -> None:
+    """Append a new entry, keeping the lookup index and statistics in step."""
+    db['entries'].append(entry)
+    _index_entry(index, entry)
+    
+    stats = db['statistics']
+    restaurant = entry.get('restaurant', 'unknown')
+    source = entry.get('source', 'unknown')
+    stats['by_restaurant'][restaurant] = stats['by_restaurant'].get(restaurant, 0) + 1
+    stats['by_source'][source] = stats['by_source'].get(source, 0) + 1
+    stats['total_dishes'] = len(db['entries'])
+
+
+def _dish_id(normalized: str, restaurant: str) -> str:
+    """
+    Entry id derived from the entry's (name, restaurant) key. Stable across
+    runs (unlike hash(), which is salted per process) and practically
+    collision-free (64-bit digest of the unique (restaurant, normalized name) key).
+    """
+    key = f"{restaurant}|{normalized}".encode('utf-8')
+    return f"dish_{hashlib.blake2b(key, digest_size=8).hexdigest()}"
 
 
+def _dish_index(db: Dict) -> Dict:
+    """
+    Lookup index over db['entries'], built once per loaded database:
+    - by_key: (dish_name_normalized, restaurant) → entry
+    - by_name: dish_name_normalized → entry (any restaurant)
+    - by_restaurant: restaurant → its entries, in database order
+    
+    by_key/by_name keep the FIRST matching entry, same as scanning the list
+    in order.
+    Rebuilt if the database object changes or entries were added behind
+    its back.
+    """
+    index = _DB_CACHE['index']
+    if index is None or index['db'] is not db or index['size'] != len(db['entries']):
+        index = {'db': db, 'size': 0, 'by_key': {}, 'by_name': {}, 'by_restaurant': {}}
+        for entry in db['entries']:
+            _index_entry(index, entry)
+        _DB_CACHE['index'] = index
+    return index
+
+
+def _index_entry(index: Dict, entry: Dict) -> None:
+    """Add a newly appended entry to the lookup index."""
+    normalized = entry['dish_name_normalized']
+    index['by_key'].setdefault((normalized, entry['restaurant']), entry)
+    index['by_name'].setdefault(normalized, entry)
+    index['by_restaurant'].setdefault(entry['restaurant'], []).append(entry)
+    index['size'] += 1
+
+
+class _PunctuationTable(dict):
+    r"""
+    str.translate table deleting everything r'[^\w\s]' matches (anything
+    that is neither a word character nor whitespace). Code points are
+    classified on first sight, so the table stays small.
+    """
+    
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        value = codepoint if (char.isalnum() or char == '_' or char.isspace()) else None
+        self[codepoint] = value
+        return value
+
+
+_PUNCT_TABLE = _PunctuationTable()
+
+
+@lru_cache(maxsize=4096)
 def normalize_dish_name(name: str) -> str:
-    """Normalize a dish name for consistent lookups."""
-    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', '', name.lower().strip()))
+    """Normalize a dish name for consistent lookups (cached - names repeat)."""
+    text = name.lower().strip().translate(_PUNCT_TABLE)
+    
+    # Collapse whitespace runs to one space. Removing punctuation can leave
+    # a space at either end ("Tacos *" → "tacos "); stored names keep it, so
+    # it is preserved here too.
+    words = text.split()
+    normalized = ' '.join(words)
+    if text[:1].isspace():
+        normalized = ' ' + normalized
+    if words and text[-1].isspace():
+        normalized += ' '
+    return normalized
 
 
+@lru_cache(maxsize=256)
 def extract_restaurant(filename: str) -> str:
     """Extract restaurant identifier from filename."""
     name = Path(filename).stem
     
     # Try to extract restaurant name
-    patterns = [
-        r'^([\w\s\']+?)[\s_-]*(menu|revision|brief|submission)',
-        r'^([\w\s\']+?)[\s_-]*\d',
-        r'^([\w\s\']+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.match(pattern, name, re.IGNORECASE)
+    for pattern in _RESTAURANT_PATTERNS:
+        match = pattern.match(name)
         if match:
-            return re.sub(r'_+', '_', re.sub(r'[^\w]', '_', match.group(1).lower().strip()))
+            return _UNDERSCORE_RUN_RE.sub('_', _NON_WORD_RE.sub('_', match.group(1).lower().strip()))
     
     return 'unknown'
 
 
 def parse_allergen_codes(codes_str: str) -> List[str]:
     """Parse allergen codes from a string like 'd,n,v'."""
-    codes = []
+    codes = set()
     for code in codes_str.upper().replace(' ', '').split(','):
         code = code.strip().rstrip('*')
         if code in ALLERGEN_CODES:
-            codes.append(code)
-    return sorted(set(codes))
+            codes.add(code)
+    return sorted(codes)
 
 
 def lookup_dish(dish_name: str, restaurant: Optional[str] = None) -> Optional[Dict]:
     """Look up allergens for a dish."""
     db = load_database()
+    index = _dish_index(db)
     normalized = normalize_dish_name(dish_name)
     
     # First try exact match with restaurant
     if restaurant:
-        for entry in db['entries']:
-            if entry['dish_name_normalized'] == normalized and entry['restaurant'] == restaurant:
-                return entry
-    
-    # Then try any restaurant
-    for entry in db['entries']:
-        if entry['dish_name_normalized'] == normalized:
+        entry = index['by_key'].get((normalized, restaurant))
+        if entry:
             return entry
     
-    return None
+    # Then try any restaurant
+    return index['by_name'].get(normalized)
 
 
+@lru_cache(maxsize=256)
 def extract_menu_date(filename: str) -> Optional[str]:
     """
     Extract menu date from filename.
@@ -195,47 +425,36 @@ def extract_menu_date(filename: str) -> Optional[str]:
     """
     name = Path(filename).stem.lower()
     
-    month_map = {
-        'jan': '01', 'january': '01',
-        'feb': '02', 'february': '02',
-        'mar': '03', 'march': '03',
-        'apr': '04', 'april': '04',
-        'may': '05',
-        'jun': '06', 'june': '06',
-        'jul': '07', 'july': '07',
-        'aug': '08', 'august': '08',
-        'sep': '09', 'september': '09',
-        'oct': '10', 'october': '10',
-        'nov': '11', 'november': '11',
-        'dec': '12', 'december': '12'
-    }
+    # Every pattern below needs digits - most filenames have no date at all
+    if not _HAS_DIGIT_RE.search(name):
+        return None
     
     # Pattern 1: D.MON.YYYY (e.g., 1.NOV.2025 or 1 NOV 2025)
-    match = re.search(r'(\d{1,2})[\.\s]?(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[\.\s]?(\d{4})', name)
+    match = _DATE_D_MON_YYYY_RE.search(name)
     if match:
         day_int = int(match.group(1))
         if 1 <= day_int <= 31:
             day = match.group(1).zfill(2)
-            month = month_map.get(match.group(2)[:3], '01')
+            month = _MONTH_NUMBERS.get(match.group(2)[:3], '01')
             year = match.group(3)
             return f"{year}-{month}-{day}"
     
     # Pattern 2: MON YYYY or MON.YYYY (e.g., "nov 2025" or "november 2025")
-    match = re.search(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[\.\s]+(\d{4})', name)
+    match = _DATE_MON_YYYY_RE.search(name)
     if match:
-        month = month_map.get(match.group(1)[:3], '01')
+        month = _MONTH_NUMBERS.get(match.group(1)[:3], '01')
         year = match.group(2)
         return f"{year}-{month}-01"  # Default to 1st of month
     
     # Pattern 3: DDMMYYYY (e.g., 07112025)
-    match = re.search(r'(\d{2})(\d{2})(\d{4})', name)
+    match = _DATE_DDMMYYYY_RE.search(name)
     if match:
         day, month, year = match.groups()
         if 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
             return f"{year}-{month}-{day}"
     
     # Pattern 4: MM.DD.YY (e.g., 11.18.25)
-    match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{2})(?!\d)', name)
+    match = _DATE_MM_DD_YY_RE.search(name)
     if match:
         month = match.group(1).zfill(2)
         day = match.group(2).zfill(2)
@@ -244,7 +463,7 @@ def extract_menu_date(filename: str) -> Optional[str]:
             return f"{year}-{month}-{day}"
     
     # Pattern 5: YYYY-MM-DD (standard ISO)
-    match = re.search(r'(\d{4})-(\d{2})-(\d{2})', name)
+    match = _DATE_ISO_RE.search(name)
     if match:
         year, month, day = match.groups()
         if 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
@@ -253,6 +472,7 @@ def extract_menu_date(filename: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=256)
 def extract_menu_type(filename: str) -> Optional[str]:
     """
     Extract menu type from filename.
@@ -310,20 +530,18 @@ def upsert_dish(
         menu_type: Type of menu (brunch, dinner, etc.)
     """
     db = load_database()
+    index = _dish_index(db)
     
     normalized = normalize_dish_name(dish_name)
     allergens = allergens or []
     
     # Check if entry exists
-    entry = None
-    for e in db['entries']:
-        if e['dish_name_normalized'] == normalized and e['restaurant'] == restaurant:
-            entry = e
-            break
+    entry = index['by_key'].get((normalized, restaurant))
+    now_iso = datetime.now().isoformat()
     
     if entry:
         # Update existing entry - but only if new info has higher confidence
-        entry['updated_at'] = datetime.now().isoformat()
+        entry['updated_at'] = now_iso
         entry['correction_count'] = entry.get('correction_count', 0) + 1
         entry['confidence'] = min(1.0, entry.get('confidence', 0.5) + 0.1)
         
@@ -341,7 +559,8 @@ def upsert_dish(
         
         if ingredients:
             existing = entry.get('ingredients', [])
-            entry['ingredients'] = list(set(existing + ingredients))
+            # Dedupe keeping first-seen order, so the saved list doesn't reshuffle
+            entry['ingredients'] = list(dict.fromkeys(existing + ingredients))
         if description:
             entry['description'] = description
         if notes:
@@ -353,7 +572,7 @@ def upsert_dish(
     else:
         # Create new entry
         entry = {
-            'id': f"dish_{int(datetime.now().timestamp())}_{hash(dish_name) % 10000:04d}",
+            'id': _dish_id(normalized, restaurant),
             'dish_name': dish_name,
             'dish_name_normalized': normalized,
             'restaurant': restaurant,
@@ -364,30 +583,44 @@ def upsert_dish(
             'price': price,
             'source': source,
             'confidence': confidence,
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat(),
+            'created_at': now_iso,
+            'updated_at': now_iso,
             'correction_count': 1,
             'notes': notes,
             'menu_date': menu_date,
             'menu_type': menu_type,
         }
-        db['entries'].append(entry)
+        _add_entry(db, index, entry)
     
-    save_database(db)
+    _commit(db)
     return entry
 
 
+def upsert_dishes_bulk(dishes: List[Dict]) -> List[Dict]:
+    """
+    Add or update many dishes with a single save.
+    
+    Each item holds upsert_dish() keyword arguments, e.g.
+    {'dish_name': 'Churros', 'allergens': ['G'], 'restaurant': 'maya'}.
+    Returns the resulting entries in the same order.
+    """
+    with batch():
+        return [upsert_dish(**dish) for dish in dishes]
+
+
 def infer_allergens_from_ingredients(text: str) -> List[str]:
     """
     Infer allergens from dish description/ingredients using AI knowledge.
     This uses the INGREDIENT_ALLERGENS mapping.
     """
     text_lower = text.lower()
-    allergens = set()
+    allergens = []
     
-    for ingredient, code in INGREDIENT_ALLERGENS.items():
-        if ingredient in text_lower:
-            allergens.add(code)
+    for code, ingredients in _INGREDIENTS_BY_CODE.items():
+        for ingredient in ingredients:
+            if ingredient in text_lower:
+                allergens.append(code)
+                break
     
     return sorted(allergens)
 
@@ -417,8 +650,7 @@ def store_allergen_correction(
     # or "Dish Name, ingredients, ingredients... d,n"
     
     # Remove the allergen codes from the end to get dish + description
-    codes_pattern = r'[,\s]*[DNGVSEFC,\*]+\s*$'
-    dish_desc = re.sub(codes_pattern, '', dish_line, flags=re.IGNORECASE).strip()
+    dish_desc = _CODES_TAIL_RE.sub('', dish_line).strip()
     
     # Try to extract just the dish name (before description)
     if ' - ' in dish_desc:
@@ -488,18 +720,18 @@ def learn_dish_from_correction(
     # Format: "Dish Name, description, description... ALLERGENS PRICE"
     
     # Extract price (number at the end)
-    price_match = re.search(r'\s+(\d+(?:\.\d{2})?)\s*$', corrected_line)
+    price_match = _PRICE_TAIL_RE.search(corrected_line)
     price = price_match.group(1) if price_match else None
     
     # Remove price from line for further parsing
-    line_without_price = re.sub(r'\s+\d+(?:\.\d{2})?\s*$', '', corrected_line).strip()
+    line_without_price = (corrected_line[:price_match.start()] if price_match else corrected_line).strip()
     
     # Extract allergen codes (letters at the end like D,G,S or *D,G)
-    allergen_match = re.search(r'\s+\*?([DNGVSEFC,\*]+)\s*$', line_without_price, re.IGNORECASE)
+    allergen_match = _ALLERGEN_TAIL_RE.search(line_without_price)
     allergens = []
     if allergen_match:
         allergens = parse_allergen_codes(allergen_match.group(1))
-        line_without_allergens = re.sub(r'\s+\*?[DNGVSEFC,\*]+\s*$', '', line_without_price, flags=re.IGNORECASE).strip()
+        line_without_allergens = line_without_price[:allergen_match.start()].strip()
     else:
         line_without_allergens = line_without_price
     
@@ -535,14 +767,18 @@ def learn_dish_from_correction(
     )
 
 
+@lru_cache(maxsize=4096)
 def _remove_price_from_line(line: str) -> str:
     """Remove price from end of a menu line for comparison purposes.
     
     Prices should NOT be compared because the same dish can have
     different prices at different restaurants or times.
+    
+    Cached: approved lines are stripped again on every comparison and
+    every prompt export.
     """
     # Remove trailing price (number at end, with or without decimals)
-    return re.sub(r'\s+\d+(?:\.\d{2})?\s*$', '', line).strip()
+    return _PRICE_TAIL_RE.sub('', line).strip()
 
 
 def compare_dish_to_database(
@@ -608,22 +844,30 @@ def search_dishes(query: str, restaurant: Optional[str] = None, limit: int = 10)
     normalized = normalize_dish_name(query)
     query_words = normalized.split()
     
-    results = []
-    for entry in db['entries']:
-        if restaurant and entry['restaurant'] != restaurant:
-            continue
-        
-        # Check if any query word matches
-        if any(word in entry['dish_name_normalized'] for word in query_words):
-            results.append(entry)
-    
-    # Sort by relevance
-    results.sort(key=lambda e: (
-        -sum(1 for w in query_words if w in e['dish_name_normalized']),
-        -e.get('confidence', 0)
-    ))
-    
-    return results[:limit]
+    if restaurant:
+        candidates = _dish_index(db)['by_restaurant'].get(restaurant, [])
+    else:
+        candidates = db['entries']
+    
+    # Score each entry once: how many query words its name contains
+    scored = []
+    for entry in candidates:
+        name = entry['dish_name_normalized']
+        score = sum(1 for word in query_words if word in name)
+        if score:
+            scored.append((score, entry))
+    
+    # Best matches by relevance, then confidence. nsmallest is a stable
+    # partial sort, so ties keep database order like a full sort would.
+    # limit=None (everything) and negative limits keep their slice meaning.
+    def rank(item):
+        return (-item[0], -item[1].get('confidence', 0))
+
+    if limit is None or limit < 0:
+        best = sorted(scored, key=rank)[:limit]
+    else:
+        best = heapq.nsmallest(limit, scored, key=rank)
+    return [entry for _, entry in best]
 
 
 def store_approved_dish(
@@ -652,19 +896,6 @@ def store_approved_dish(
     if not dish_line or len(dish_line.strip()) < 5:
         return None
     
-    line_lower = dish_line.lower().strip()
-    
-    # Skip lines that are clearly not menu items
-    skip_patterns = [
-        'consuming raw', 'foodborne illness', 'allergen key', 
-        'vegetarian', 'vegan', 'gluten free', 'dairy free',
-        'step 1', 'step 2', 'step 3', 'obtain', 'design request',
-        'page ', 'menu submission', 'restaurant name', 'venue',
-        'template', 'brief', 'guidelines', 'rsh design'
-    ]
-    if any(pattern in line_lower for pattern in skip_patterns):
-        return None
-    
     # Skip lines that are ALL CAPS (headers/sections)
     if dish_line.isupper():
         return None
@@ -673,6 +904,18 @@ def store_approved_dish(
     if len(dish_line.split()) < 2:
         return None
     
+    line_lower = dish_line.lower().strip()
+    
+    # Skip lines starting with numbers - the dish name would too (checked
+    # again below), so there is no point parsing them
+    if line_lower[0].isdigit():
+        return None
+    
+    # Skip lines that are clearly not menu items
+    for phrase in _SKIP_LINE_PHRASES:
+        if phrase in line_lower:
+            return None
+    
     # Parse the line to extract components
     # Format variations:
     # - "Dish Name, ingredient, ingredient... D,G 18"
@@ -680,11 +923,11 @@ def store_approved_dish(
     # - "Dish Name, ingredient (V) 15"
     
     # Extract price (number at the end, possibly after allergens)
-    price_match = re.search(r'\s+(\d+(?:\|\d+)?)\s*$', dish_line)
+    price_match = _LINE_PRICE_RE.search(dish_line)
     price = price_match.group(1) if price_match else None
     
     # Remove price from line
-    line_no_price = re.sub(r'\s+\d+(?:\|\d+)?\s*$', '', dish_line).strip()
+    line_no_price = (dish_line[:price_match.start()] if price_match else dish_line).strip()
     
     # Extract allergen codes - two patterns:
     # 1. At end without parens: "... D,G" or "... *D,G"
@@ -692,17 +935,17 @@ def store_approved_dish(
     allergens = []
     
     # Pattern 1: Parens at end like (D, E, F) or (V)
-    paren_match = re.search(r'\(([A-Z,\s\*]+)\)\s*$', line_no_price)
+    paren_match = _LINE_PAREN_ALLERGENS_RE.search(line_no_price)
     if paren_match:
         allergen_str = paren_match.group(1).replace(' ', '')
         allergens = parse_allergen_codes(allergen_str)
-        line_no_allergens = re.sub(r'\s*\([A-Z,\s\*]+\)\s*$', '', line_no_price).strip()
+        line_no_allergens = line_no_price[:paren_match.start()].strip()
     else:
         # Pattern 2: No parens like "... D,G" or "... *D,G"
-        allergen_match = re.search(r'\s+\*?([A-Z,\*]+)\s*$', line_no_price)
+        allergen_match = _LINE_ALLERGENS_RE.search(line_no_price)
         if allergen_match:
             allergens = parse_allergen_codes(allergen_match.group(1))
-            line_no_allergens = re.sub(r'\s+\*?[A-Z,\*]+\s*$', '', line_no_price).strip()
+            line_no_allergens = line_no_price[:allergen_match.start()].strip()
         else:
             line_no_allergens = line_no_price
     
@@ -774,18 +1017,16 @@ def store_dish_terminology_correction(
         The created/updated database entry
     """
     db = load_database()
+    index = _dish_index(db)
     normalized = normalize_dish_name(dish_name)
     
     # Look for existing entry
-    entry = None
-    for e in db['entries']:
-        if e['dish_name_normalized'] == normalized and e['restaurant'] == restaurant:
-            entry = e
-            break
+    entry = index['by_key'].get((normalized, restaurant))
+    now_iso = datetime.now().isoformat()
     
     if entry:
         # Update existing entry
-        entry['updated_at'] = datetime.now().isoformat()
+        entry['updated_at'] = now_iso
         entry['correction_count'] = entry.get('correction_count', 0) + 1
         entry['confidence'] = min(1.0, entry.get('confidence', 0.5) + 0.15)
         
@@ -799,7 +1040,7 @@ def store_dish_terminology_correction(
     else:
         # Create new entry focused on terminology
         entry = {
-            'id': f"dish_{int(datetime.now().timestamp())}_{hash(dish_name) % 10000:04d}",
+            'id': _dish_id(normalized, restaurant),
             'dish_name': dish_name,
             'dish_name_normalized': normalized,
             'restaurant': restaurant,
@@ -810,17 +1051,17 @@ def store_dish_terminology_correction(
             'price': None,
             'source': 'terminology_training',
             'confidence': 0.6,  # Higher initial confidence for terminology
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat(),
+            'created_at': now_iso,
+            'updated_at': now_iso,
             'correction_count': 1,
             'terminology_corrections': [
                 {'from': original_term, 'to': corrected_term}
             ],
             'notes': f"Learned terminology: '{original_term}' → '{corrected_term}'"
         }
-        db['entries'].append(entry)
+        _add_entry(db, index, entry)
     
-    save_database(db)
+    _commit(db)
     return entry
 
 
@@ -864,6 +1105,17 @@ def export_for_ai_prompt() -> str:
     """
     db = load_database()
     
+    # Same database, no changes since the last export - reuse the text
+    if _EXPORT_CACHE['db'] is db and _EXPORT_CACHE['version'] == _DB_CACHE['version']:
+        return _EXPORT_CACHE['text']
+    
+    text = _render_ai_prompt(db)
+    _EXPORT_CACHE.update(db=db, version=_DB_CACHE['version'], text=text)
+    return text
+
+
+def _render_ai_prompt(db: Dict) -> str:
+    """Build the export_for_ai_prompt() text for a database."""
     if not db['entries']:
         return ""
     
@@ -872,27 +1124,20 @@ def export_for_ai_prompt() -> str:
     lines.append("NOTE: Prices may vary - do NOT flag price differences as errors.\n")
     
     # Collect terminology corrections across all dishes
-    terminology_by_dish = {}
+    terminology_by_dish = defaultdict(list)
     
     # Group by restaurant
-    by_restaurant = {}
+    by_restaurant = defaultdict(list)
     for entry in db['entries']:
-        restaurant = entry['restaurant']
-        if restaurant not in by_restaurant:
-            by_restaurant[restaurant] = []
-        by_restaurant[restaurant].append(entry)
+        by_restaurant[entry['restaurant']].append(entry)
         
         # Track terminology corrections
         if entry.get('terminology_corrections'):
-            dish_name = entry['dish_name']
-            for tc in entry['terminology_corrections']:
-                if dish_name not in terminology_by_dish:
-                    terminology_by_dish[dish_name] = []
-                terminology_by_dish[dish_name].append(tc)
+            terminology_by_dish[entry['dish_name']].extend(entry['terminology_corrections'])
     
     for restaurant, dishes in by_restaurant.items():
         lines.append(f"\n{restaurant.replace('_', ' ').title()}:")
-        for dish in sorted(dishes, key=lambda d: d['dish_name']):
+        for dish in sorted(dishes, key=itemgetter('dish_name')):
             # Show description WITHOUT price (price can vary)
             if dish.get('full_line'):
                 desc_no_price = _remove_price_from_line(dish['full_line'])
@@ -908,16 +1153,20 @@ def export_for_ai_prompt() -> str:
             
             # Show terminology corrections for this dish
             if dish.get('terminology_corrections'):
-                for tc in dish['terminology_corrections']:
-                    lines.append(f"      ⚠ Use \"{tc['to']}\" not \"{tc['from']}\"")
+                lines.extend(
+                    f"      ⚠ Use \"{tc['to']}\" not \"{tc['from']}\""
+                    for tc in dish['terminology_corrections']
+                )
     
     # Summary of dish-specific terminology corrections
     if terminology_by_dish:
         lines.append("\n\nDISH-SPECIFIC TERMINOLOGY:")
         lines.append("When reviewing these dishes, apply these corrections with HIGH confidence:\n")
-        for dish_name, corrections in sorted(terminology_by_dish.items()):
-            for tc in corrections:
-                lines.append(f"  • {dish_name}: \"{tc['from']}\" → \"{tc['to']}\"")
+        lines.extend(
+            f"  • {dish_name}: \"{tc['from']}\" → \"{tc['to']}\""
+            for dish_name, corrections in sorted(terminology_by_dish.items())
+            for tc in corrections
+        )
     
     return '\n'.join(lines)
 
@@ -12,7 +12,7 @@ import re
 import sys
 from html import escape
 from docx import Document
-from docx.enum.text import WD_COLOR_INDEX
+from docx.enum.text import WD_COLOR_INDEX, WD_UNDERLINE
 from docx.oxml.ns import qn
 from docx.text.run import Run
 
@@ -24,33 +24,36 @@ BOUNDARY_MARKERS = [
 
 # ── Module-level helpers ─────────────────────────────────────────────────────
 
-def local_name(tag):
-    """Extract the local name from an XML tag, stripping namespace."""
-    if not isinstance(tag, str):
-        return ""
-    if "}" in tag:
-        return tag.split("}", 1)[1]
-    return tag
+# Tracked-change wrappers, matched by local name in any namespace
+DELETION_TAGS = ("{*}del", "{*}moveFrom")
+INSERTION_TAGS = ("{*}ins", "{*}moveTo")
 
 
 def run_is_in_deleted_change(run):
     """Return True if the run sits inside a tracked deletion (w:del / w:moveFrom)."""
-    node = run._r
-    while node is not None:
-        if local_name(node.tag) in {"del", "moveFrom"}:
-            return True
-        node = node.getparent()
-    return False
+    return next(run._r.iterancestors(*DELETION_TAGS), None) is not None
+
+
+def deleted_runs_in_paragraph(paragraph):
+    """Return the set of w:r elements in the paragraph that sit inside a
+    tracked deletion (w:del / w:moveFrom), for `run._r in deleted` checks.
+
+    Same answer as run_is_in_deleted_change() for each run, but found with
+    lxml's C-level tag iteration once per paragraph instead of walking every
+    run's ancestors."""
+    p = paragraph._p
+    # A deletion wrapping the whole paragraph covers all of its runs
+    if next(p.iterancestors(*DELETION_TAGS), None) is not None:
+        return set(p.iter(qn("w:r")))
+    deleted = set()
+    for wrapper in p.iter(*DELETION_TAGS):
+        deleted.update(wrapper.iter(qn("w:r")))
+    return deleted
 
 
 def run_is_in_inserted_change(run):
     """Return True if the run sits inside a tracked insertion (w:ins / w:moveTo)."""
-    node = run._r
-    while node is not None:
-        if local_name(node.tag) in {"ins", "moveTo"}:
-            return True
-        node = node.getparent()
-    return False
+    return next(run._r.iterancestors(*INSERTION_TAGS), None) is not None
 
 
 def run_has_highlight(run):
@@ -61,6 +64,24 @@ def run_has_highlight(run):
         return False
 
 
+def run_inline_formatting(run):
+    """Return (bold, italic, underline) as plain bools - the truthiness of
+    run.bold / run.italic / run.underline - from one w:rPr lookup.
+
+    Each of those python-docx properties builds a Font proxy and finds rPr
+    again; reading the w:b / w:i / w:u children directly keeps their parsed
+    values (w:b w:val="0" is off, w:u w:val="none" is no underline)."""
+    rPr = run._r.rPr
+    if rPr is None:
+        return False, False, False
+    b, i, u = rPr.b, rPr.i, rPr.u
+    return (
+        b is not None and b.val,
+        i is not None and i.val,
+        u is not None and u.val not in (None, WD_UNDERLINE.NONE),
+    )
+
+
 def run_is_struck_through(run):
     """Return True if the run has single OR double strikethrough."""
     try:
@@ -129,12 +150,13 @@ def paragraph_clean_text(paragraph):
     if not runs:
         return collapse_inline_whitespace(paragraph.text)
 
+    deleted = deleted_runs_in_paragraph(paragraph)
     cleaned_parts = []
     for run in runs:
         text = run.text or ""
         if not text:
             continue
-        if run_is_in_deleted_change(run):
+        if run._r in deleted:
             continue
         if run_is_struck_through(run):
             continue
@@ -148,30 +170,53 @@ def paragraph_clean_html(paragraph):
     Build cleaned HTML paragraph preserving basic inline formatting:
     bold, italic, underline. Tracked/manual deletions are removed.
     """
+    return paragraph_clean_text_and_html(paragraph)[1]
+
+
+def paragraph_clean_text_and_html(paragraph):
+    """
+    Return (paragraph_clean_text(p), paragraph_clean_html(p)) from a single
+    walk over the paragraph's runs, so clean mode reads each run's text and
+    strike/deletion state once instead of twice.
+    """
+    runs = all_runs_in_paragraph(paragraph)
+    deleted = deleted_runs_in_paragraph(paragraph)
+
+    cleaned_parts = []
     fragments = []
     whitespace_state = {"ends_with_space": False}
-    for run in all_runs_in_paragraph(paragraph):
-        if run_is_in_deleted_change(run):
+    for run in runs:
+        if run._r in deleted:
             continue
         if run_is_struck_through(run):
             continue
 
-        text = normalize_clean_run_text(run.text or "", whitespace_state)
+        raw = run.text or ""
+        if raw:
+            cleaned_parts.append(raw)
+
+        # Empty runs still reset the boundary-space state, as before
+        text = normalize_clean_run_text(raw, whitespace_state)
         if not text:
             continue
 
         chunk = escape(text).replace("\n", "<br>")
-        if run.bold:
+        bold, italic, underline = run_inline_formatting(run)
+        if bold:
             chunk = f"<strong>{chunk}</strong>"
-        if run.italic:
+        if italic:
             chunk = f"<em>{chunk}</em>"
-        if run.underline:
+        if underline:
             chunk = f"<u>{chunk}</u>"
         fragments.append(chunk)
 
+    if runs:
+        cleaned_text = collapse_inline_whitespace("".join(cleaned_parts))
+    else:
+        cleaned_text = collapse_inline_whitespace(paragraph.text)
     if not fragments:
-        return "<p><br></p>"
-    return f"<p>{''.join(fragments)}</p>"
+        return cleaned_text, "<p><br></p>"
+    return cleaned_text, f"<p>{''.join(fragments)}</p>"
 
 
 # ── Unapproved mode (preserves existing redlines) ────────────────────────────
@@ -200,22 +245,24 @@ def paragraph_unapproved_html(paragraph):
     - Everything else rendered normally with bold/italic/underline.
     """
     fragments = []
+    deleted = deleted_runs_in_paragraph(paragraph)
     for run in all_runs_in_paragraph(paragraph):
         text = run.text or ""
         if not text:
             continue
 
-        is_deleted = run_is_in_deleted_change(run) or run_is_struck_through(run)
+        is_deleted = run._r in deleted or run_is_struck_through(run)
         is_inserted = run_is_in_inserted_change(run) or run_has_highlight(run)
 
         chunk = escape(text).replace("\n", "<br>")
 
         # Apply inline formatting
-        if run.bold:
+        bold, italic, underline = run_inline_formatting(run)
+        if bold:
             chunk = f"<strong>{chunk}</strong>"
-        if run.italic:
+        if italic:
             chunk = f"<em>{chunk}</em>"
-        if run.underline and not is_deleted:
+        if underline and not is_deleted:
             chunk = f"<u>{chunk}</u>"
 
         # Wrap with redline class (deletion takes priority if both flags set)
@@ -239,13 +286,14 @@ def paragraph_annotation_ranges(paragraph):
     """
     annotations = []
     offset = 0
+    deleted = deleted_runs_in_paragraph(paragraph)
     for run in all_runs_in_paragraph(paragraph):
         text = run.text or ""
         if not text:
             continue
 
         length = len(text)
-        is_deleted = run_is_in_deleted_change(run) or run_is_struck_through(run)
+        is_deleted = run._r in deleted or run_is_struck_through(run)
         is_inserted = run_is_in_inserted_change(run) or run_has_highlight(run)
 
         if is_deleted:
@@ -262,12 +310,13 @@ def paragraph_annotation_ranges(paragraph):
 
 def extract_texts(docx_path, mode="clean"):
     doc = Document(docx_path)
-    boundary_index = find_boundary_index(doc.paragraphs)
+    paragraphs = doc.paragraphs  # rebuilt on every access, so take it once
+    boundary_index = find_boundary_index(paragraphs)
 
     if boundary_index is None:
-        source_paragraphs = doc.paragraphs
+        source_paragraphs = paragraphs
     else:
-        source_paragraphs = doc.paragraphs[boundary_index + 1 :]
+        source_paragraphs = paragraphs[boundary_index + 1 :]
 
     raw_lines = []
     cleaned_lines = []
@@ -294,9 +343,9 @@ def extract_texts(docx_path, mode="clean"):
             unapproved_html_paragraphs.append(paragraph_unapproved_html(paragraph))
             all_annotations.append(paragraph_annotation_ranges(paragraph))
         else:
-            cleaned_text = paragraph_clean_text(paragraph)
+            cleaned_text, cleaned_html = paragraph_clean_text_and_html(paragraph)
             cleaned_lines.append(cleaned_text)
-            cleaned_html_paragraphs.append(paragraph_clean_html(paragraph))
+            cleaned_html_paragraphs.append(cleaned_html)
 
     # Trim trailing blank lines
     while raw_lines and not raw_lines[-1].strip():
@@ -26,25 +26,16 @@ def extract_pdf_text(pdf_path: str) -> dict:
     """
     doc = fitz.open(pdf_path)
 
-    pages = []
-    full_text_parts = []
-    has_text_layer = False
-
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        text = page.get_text("text")
-        pages.append(text)
-        full_text_parts.append(text)
-        if text.strip():
-            has_text_layer = True
+    pages = [page.get_text("text") for page in doc]
 
     doc.close()
 
     return {
         "pages": pages,
-        "full_text": "\n".join(full_text_parts),
+        "full_text": "\n".join(pages),
         "page_count": len(pages),
-        "has_text_layer": has_text_layer
+        # Stops at the first page with any text
+        "has_text_layer": any(text.strip() for text in pages)
     }
 
 
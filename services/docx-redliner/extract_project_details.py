@@ -27,6 +27,21 @@ ALLERGEN_KEYWORDS = [
     "sesame",
 ]
 
+# One pass over a (lowercased) label instead of an `in` test per keyword
+_ALLERGEN_KEYWORD_RE = re.compile("|".join(map(re.escape, ALLERGEN_KEYWORDS)))
+
+# "G gluten" / "*PN peanuts" segments of a pipe-delimited legend line
+_PIPE_LEGEND_PART_RE = re.compile(r"^\*?\s*([A-Za-z]{1,3})\s+([A-Za-z][A-Za-z\s/&\-]{2,})$")
+
+# "(C) CELERY (D) DAIRY ..." legends and the footer copy that can follow them
+_LEGEND_FOOTER_RE = re.compile(
+    r"\b(?:ALL\s+PRICES|WE\s+WELCOME|CONSUMPTION\s+OF\s+RAW|CONSUMING\s+RAW|FOODBORNE\s+ILLNESS)\b",
+    re.IGNORECASE,
+)
+_PAREN_LEGEND_RE = re.compile(
+    r"\(\s*([A-Za-z]{1,3})\s*\)\s*([A-Za-z][A-Za-z\s/&\-]*?)(?=\s*\(\s*[A-Za-z]{1,3}\s*\)|$)"
+)
+
 
 def _normalize_allergen_label(label: str) -> str:
     return " ".join(label.split()).strip().lower()
@@ -42,18 +57,10 @@ def _parse_parenthesized_allergen_key(text: str) -> str:
 
     # Footer copy often follows the legend in the same text extraction stream.
     # Trim it so the last allergen label does not absorb boilerplate text.
-    text = re.split(
-        r"\b(?:ALL\s+PRICES|WE\s+WELCOME|CONSUMPTION\s+OF\s+RAW|CONSUMING\s+RAW|FOODBORNE\s+ILLNESS)\b",
-        text,
-        flags=re.IGNORECASE,
-        maxsplit=1,
-    )[0]
+    text = _LEGEND_FOOTER_RE.split(text, maxsplit=1)[0]
 
     pairs = []
-    pattern = re.compile(
-        r"\(\s*([A-Za-z]{1,3})\s*\)\s*([A-Za-z][A-Za-z\s/&\-]*?)(?=\s*\(\s*[A-Za-z]{1,3}\s*\)|$)"
-    )
-    for match in pattern.finditer(text):
+    for match in _PAREN_LEGEND_RE.finditer(text):
         code = match.group(1).upper()
         label = _normalize_allergen_label(match.group(2))
         if not label:
@@ -63,10 +70,7 @@ def _parse_parenthesized_allergen_key(text: str) -> str:
     if len(pairs) < 4:
         return ""
 
-    keyword_hits = sum(
-        1 for _, label in pairs
-        if any(keyword in label for keyword in ALLERGEN_KEYWORDS)
-    )
+    keyword_hits = sum(1 for _, label in pairs if _ALLERGEN_KEYWORD_RE.search(label))
     if keyword_hits < 2:
         return ""
 
@@ -79,25 +83,25 @@ def detect_allergen_key(paragraphs) -> str:
     Returns a single line string like:
     "C crustaceans | D dairy | E egg | F fish | G gluten | N nuts"
     """
+    # Pipe-delimited legends are checked as the lines are collected, so the
+    # rest of the document isn't read once one is found
     candidate_lines = []
     for paragraph in paragraphs:
         text = (paragraph.text or "").strip()
-        if text:
-            candidate_lines.append(" ".join(text.split()))
-
-    for line in candidate_lines:
-        lower = line.lower()
-
-        if "allergen" in lower and "|" in line:
-            return line
+        if not text:
+            continue
+        line = " ".join(text.split())
+        candidate_lines.append(line)
 
         if "|" not in line:
             continue
 
-        parts = [p.strip() for p in line.split("|") if p.strip()]
+        if "allergen" in line.lower():
+            return line
+
         parsed = []
-        for part in parts:
-            match = re.match(r"^\*?\s*([A-Za-z]{1,3})\s+([A-Za-z][A-Za-z\s/&\-]{2,})$", part)
+        for part in line.split("|"):
+            match = _PIPE_LEGEND_PART_RE.match(part.strip())
             if not match:
                 continue
             code = match.group(1).upper()
@@ -105,10 +109,7 @@ def detect_allergen_key(paragraphs) -> str:
             parsed.append((code, label))
 
         if len(parsed) >= 4:
-            keyword_hits = sum(
-                1 for _, label in parsed
-                if any(keyword in label.lower() for keyword in ALLERGEN_KEYWORDS)
-            )
+            keyword_hits = sum(1 for _, label in parsed if _ALLERGEN_KEYWORD_RE.search(label.lower()))
             if keyword_hits >= 2:
                 return " | ".join(f"{code} {label}" for code, label in parsed)
 
@@ -198,6 +199,10 @@ def extract_project_details(docx_path: str) -> dict:
     if len(doc.tables) > 0:
         table = doc.tables[0]
         for row in table.rows:
+            # First value wins, so once every field is set the remaining rows
+            # can't change anything - skip building their cells
+            if all(project_details.values()):
+                break
             cells = row.cells
             if len(cells) >= 2:
                 field_name = cells[0].text.strip()
@@ -226,7 +231,10 @@ def extract_project_details(docx_path: str) -> dict:
     ]
     boundary_index = None
 
-    for i, paragraph in enumerate(doc.paragraphs):
+    # doc.paragraphs builds a new list of wrappers on every access - take it once
+    paragraphs = doc.paragraphs
+
+    for i, paragraph in enumerate(paragraphs):
         para_text = paragraph.text.strip()
         if para_text == "MENU":
             boundary_index = i
@@ -239,8 +247,8 @@ def extract_project_details(docx_path: str) -> dict:
     # Also skip instruction lines that follow the boundary
     menu_lines = []
     if boundary_index is not None:
-        for i in range(boundary_index + 1, len(doc.paragraphs)):
-            text = doc.paragraphs[i].text
+        for paragraph in paragraphs[boundary_index + 1:]:
+            text = paragraph.text
             stripped = text.strip()
             # Skip the instruction line and standalone "MENU" markers
             if stripped == "MENU" or "Please drop the menu content below" in stripped:
@@ -250,7 +258,7 @@ def extract_project_details(docx_path: str) -> dict:
         # No boundary found — try to get all text after the table
         # Skip paragraphs that look like header/template content
         in_content = False
-        for paragraph in doc.paragraphs:
+        for paragraph in paragraphs:
             text = paragraph.text.strip()
             if in_content:
                 menu_lines.append(paragraph.text)
@@ -264,7 +272,7 @@ def extract_project_details(docx_path: str) -> dict:
         menu_lines.pop()
 
     menu_content = "\n".join(menu_lines)
-    allergen_key = detect_allergen_key(doc.paragraphs)
+    allergen_key = detect_allergen_key(paragraphs)
 
     return {
         "project_details": project_details,
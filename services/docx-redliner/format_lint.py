@@ -14,8 +14,12 @@ from typing import List, Dict
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt
 
 BOUNDARY_MARKER = "Please drop the menu content below on page 2."
+SOP_FONT_SIZE = Pt(12)
+# Offending paragraphs reported per check
+SAMPLE_LIMIT = 5
 
 
 def paragraph_text(para) -> str:
@@ -35,49 +39,57 @@ def check_font_rules(para) -> Dict[str, bool]:
         text = (run.text or "").strip()
         if not text:
             continue
-        # Size: if explicitly set and not 12pt (152400 EMU) -> mismatch
-        if run.font.size is not None:
-            # font.size is a Length (EMU). 12 pt == 152400
-            try:
-                if int(run.font.size) != 152400:
-                    issues["size_mismatch"] = True
-            except Exception:
-                issues["size_mismatch"] = True
+        # run.font builds a new Font proxy on every access
+        font = run.font
+        # Size: if explicitly set and not 12pt -> mismatch. Length is an int
+        # (EMU), so this compares against 152400 directly
+        size = font.size
+        if size is not None and size != SOP_FONT_SIZE:
+            issues["size_mismatch"] = True
         # Font: if explicitly set and not Calibri variants -> mismatch
-        if run.font.name:
-            name = run.font.name.lower()
-            if "calibri" not in name:
-                issues["font_mismatch"] = True
+        name = font.name
+        if name and "calibri" not in name.lower():
+            issues["font_mismatch"] = True
+        if issues["size_mismatch"] and issues["font_mismatch"]:
+            break
     return issues
 
 
 def lint(file_path: str) -> Dict:
     doc = Document(file_path)
+    paragraphs = doc.paragraphs  # rebuilt on every access, so take it once
     marker_found = False
-    menu_paragraphs: List = []
+    # (paragraph, text) for non-empty lines, keeping the text for the checks below
+    menu_items: List = []
 
-    for para in doc.paragraphs:
+    for para in paragraphs:
         if marker_found:
-            menu_paragraphs.append(para)
+            text = paragraph_text(para)
+            if text:
+                menu_items.append((para, text))
         elif BOUNDARY_MARKER in para.text:
             marker_found = True
 
     if not marker_found:
         # fallback: treat entire doc
-        menu_paragraphs = [p for p in doc.paragraphs if paragraph_text(p)]
+        for para in paragraphs:
+            text = paragraph_text(para)
+            if text:
+                menu_items.append((para, text))
 
-    # filter out empty lines
-    menu_paragraphs = [p for p in menu_paragraphs if paragraph_text(p)]
-
-    total = len(menu_paragraphs)
+    total = len(menu_items)
     centered_offenders = []
     size_offenders = []
     font_offenders = []
 
-    for p in menu_paragraphs:
-        text = paragraph_text(p)
+    for p, text in menu_items:
+        # Every paragraph counts towards the centered ratio
         if not is_centered(p):
             centered_offenders.append(text[:120])
+        # Size/font only report samples and pass on zero offenders, so stop
+        # checking runs once both have a full set of samples
+        if len(size_offenders) >= SAMPLE_LIMIT and len(font_offenders) >= SAMPLE_LIMIT:
+            continue
         fr = check_font_rules(p)
         if fr["size_mismatch"]:
             size_offenders.append(text[:120])
@@ -111,9 +123,9 @@ def lint(file_path: str) -> Dict:
             "menu_paragraphs": total,
         },
         "samples": {
-            "not_centered": centered_offenders[:5],
-            "size_mismatch": size_offenders[:5],
-            "font_mismatch": font_offenders[:5],
+            "not_centered": centered_offenders[:SAMPLE_LIMIT],
+            "size_mismatch": size_offenders[:SAMPLE_LIMIT],
+            "font_mismatch": font_offenders[:SAMPLE_LIMIT],
         },
         "reasons": reasons,
     }
@@ -97,30 +97,31 @@ class MenuHTMLParser(HTMLParser):
         }]
 
     def handle_starttag(self, tag, attrs):
-        if tag in ['p', 'br']:
+        if tag in ('p', 'br'):
             # New line
             if self.current_line:
                 self.lines.append(self.current_line)
                 self.current_line = []
 
-        current = dict(self.format_stack[-1])
-        attr_map = dict(attrs or [])
-        class_attr = attr_map.get('class', '')
-        class_names = set(class_attr.split()) if class_attr else set()
+        # Stack entries are never modified in place, so tags that don't change
+        # formatting share their parent's state instead of copying it
+        current = self.format_stack[-1]
 
-        if tag in ['strong', 'b']:
-            current['bold'] = True
-        elif tag in ['em', 'i']:
-            current['italic'] = True
+        if tag in ('strong', 'b'):
+            current = dict(current, bold=True)
+        elif tag in ('em', 'i'):
+            current = dict(current, italic=True)
         elif tag == 'u':
-            current['underline'] = True
-        elif tag in ['s', 'del', 'strike']:
-            current['strike'] = True
+            current = dict(current, underline=True)
+        elif tag in ('s', 'del', 'strike'):
+            current = dict(current, strike=True)
         elif tag == 'span':
+            class_attr = dict(attrs or []).get('class', '')
+            class_names = set(class_attr.split()) if class_attr else set()
             if 'persistent-del' in class_names or 'existing-del' in class_names:
-                current['strike'] = True
+                current = dict(current, strike=True)
             if 'persistent-ins' in class_names or 'existing-ins' in class_names:
-                current['highlight'] = True
+                current = dict(current, highlight=True)
 
         self.format_stack.append(current)
 
@@ -12,8 +12,8 @@ Format: (original, corrected)
 - Example: ('mayo', 'aioli'), ('aioli', 'mayo')
 """
 
-# Terminology preferences (bidirectional)
-KNOWN_PAIRS = {
+# Terminology preferences (bidirectional). Read-only - edit this file to add pairs
+KNOWN_PAIRS = frozenset({
     # NOTE: mayo/aioli removed - not an absolute rule, clients may prefer either
 
     # Abbreviations
@@ -62,7 +62,7 @@ KNOWN_PAIRS = {
     
     # Term standardization
     ('shrimp', 'prawn'), ('prawn', 'shrimp'),
-}
+})
 
 # Terminology pairs that are NOT bidirectional (one-way corrections)
 # These are RSH-specific word preferences: always use the corrected term
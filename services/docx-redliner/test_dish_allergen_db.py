@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Tests for the JSON-backed dish database."""
+
+import json
+
+import pytest
+
+import dish_allergen_db
+
+
+@pytest.fixture(autouse=True)
+def temp_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "dish-allergens.json"
+    monkeypatch.setattr(dish_allergen_db, "DB_PATH", db_path)
+    monkeypatch.setattr(dish_allergen_db, "_DB_CACHE", {"path": None, "stamp": None, "db": None, "index": None, "version": 0})
+    return db_path
+
+
+def test_upserted_dish_can_be_looked_up():
+    dish_allergen_db.upsert_dish("Tuna Tartare", ["G", "D"], "maya", full_line="Tuna Tartare, ponzu D,G 18")
+
+    entry = dish_allergen_db.lookup_dish("tuna tartare!", "maya")
+
+    assert entry["dish_name"] == "Tuna Tartare"
+    assert entry["allergens"] == ["D", "G"]
+    assert dish_allergen_db.get_statistics()["by_restaurant"] == {"maya": 1}
+
+
+def test_load_reuses_parsed_database_until_file_changes(temp_db):
+    dish_allergen_db.upsert_dish("Red Paloma", ["V"], "maya")
+
+    first = dish_allergen_db.load_database()
+    assert dish_allergen_db.load_database() is first
+
+    # Another writer (e.g. the Node dish service) replaces the file
+    data = json.loads(temp_db.read_text())
+    data["entries"][0]["allergens"] = ["V", "G"]
+    temp_db.write_text(json.dumps(data, indent=4))
+
+    reloaded = dish_allergen_db.load_database()
+    assert reloaded is not first
+    assert reloaded["entries"][0]["allergens"] == ["V", "G"]
+
+
+def test_missing_database_is_created_empty(temp_db):
+    db = dish_allergen_db.load_database()
+
+    assert db["entries"] == []
+    assert temp_db.exists()
+
+
+def test_lookup_prefers_restaurant_match_then_first_any_restaurant():
+    dish_allergen_db.upsert_dish("Guacamole", ["V"], "maya")
+    dish_allergen_db.upsert_dish("Guacamole", ["V", "N"], "dlena")
+
+    assert dish_allergen_db.lookup_dish("Guacamole", "dlena")["restaurant"] == "dlena"
+    assert dish_allergen_db.lookup_dish("Guacamole", "other")["restaurant"] == "maya"
+    assert dish_allergen_db.lookup_dish("Guacamole")["restaurant"] == "maya"
+    assert dish_allergen_db.lookup_dish("Queso") is None
+
+
+def test_batch_defers_the_write_until_the_block_exits(temp_db):
+    dish_allergen_db.upsert_dish("Red Paloma", ["V"], "maya")
+    before = temp_db.read_text()
+
+    with dish_allergen_db.batch():
+        dish_allergen_db.upsert_dish("Churros", ["G", "D"], "maya")
+        dish_allergen_db.store_dish_terminology_correction("Red Paloma", "crust", "rim", "maya")
+        assert temp_db.read_text() == before
+        assert dish_allergen_db.lookup_dish("Churros", "maya") is not None
+
+    saved = json.loads(temp_db.read_text())
+    assert [e["dish_name"] for e in saved["entries"]] == ["Red Paloma", "Churros"]
+    assert saved["entries"][0]["terminology_corrections"] == [{"from": "crust", "to": "rim"}]
+    assert saved["statistics"]["total_dishes"] == 2
+
+
+def test_export_reflects_updates_made_after_a_previous_export():
+    dish_allergen_db.upsert_dish("Churros", ["G"], "maya", full_line="Churros, cinnamon sugar G 9")
+    first = dish_allergen_db.export_for_ai_prompt()
+    assert "✓ Churros, cinnamon sugar G" in first
+    assert dish_allergen_db.export_for_ai_prompt() == first
+
+    with dish_allergen_db.batch():
+        dish_allergen_db.store_dish_terminology_correction("Churros", "sugar", "azucar", "maya")
+        assert '⚠ Use "azucar" not "sugar"' in dish_allergen_db.export_for_ai_prompt()
+
+
+def test_new_entries_get_a_stable_id_per_restaurant():
+    maya = dish_allergen_db.upsert_dish("Red Paloma", ["V"], "maya")
+    other = dish_allergen_db.store_dish_terminology_correction("Red  Paloma!", "crust", "rim", "other")
+
+    assert maya["id"] == dish_allergen_db._dish_id("red paloma", "maya")
+    assert other["id"] != maya["id"]
+    assert dish_allergen_db.upsert_dish("RED PALOMA", ["V"], "maya")["id"] == maya["id"]
+
+
+def test_merged_ingredients_keep_first_seen_order():
+    dish_allergen_db.upsert_dish("Churros", ["G"], "maya", ingredients=["flour", "sugar", "cinnamon"])
+    entry = dish_allergen_db.upsert_dish("Churros", ["G"], "maya", ingredients=["chocolate", "sugar"])
+
+    assert entry["ingredients"] == ["flour", "sugar", "cinnamon", "chocolate"]
+
+
+def test_reload_database_rereads_the_file():
+    dish_allergen_db.upsert_dish("Red Paloma", ["V"], "maya")
+    cached = dish_allergen_db.load_database()
+
+    reloaded = dish_allergen_db.reload_database()
+
+    assert reloaded is not cached
+    assert reloaded == cached
+    assert dish_allergen_db.load_database() is reloaded
+
+
+def test_bulk_upsert_saves_once(temp_db, monkeypatch):
+    dish_allergen_db.load_database()
+    saves = []
+    real_save = dish_allergen_db.save_database
+    monkeypatch.setattr(dish_allergen_db, "save_database", lambda db: saves.append(1) or real_save(db))
+
+    entries = dish_allergen_db.upsert_dishes_bulk([
+        {"dish_name": "Churros", "allergens": ["G"], "restaurant": "maya"},
+        {"dish_name": "Guacamole", "allergens": ["V"], "restaurant": "maya"},
+        {"dish_name": "churros!", "allergens": ["G", "D"], "restaurant": "maya"},
+    ])
+
+    assert len(saves) == 1
+    assert entries[0] is entries[2]
+    assert entries[0]["allergens"] == ["D", "G"]
+    assert len(json.loads(temp_db.read_text())["entries"]) == 2
+
+
+def test_search_limit_keeps_slice_semantics():
+    with dish_allergen_db.batch():
+        for name in ("Fish Taco", "Fish Tostada", "Fish Ceviche"):
+            dish_allergen_db.upsert_dish(name, ["F"], "maya")
+
+    def names(limit):
+        return [e["dish_name"] for e in dish_allergen_db.search_dishes("fish", limit=limit)]
+
+    assert names(2) == ["Fish Taco", "Fish Tostada"]
+    assert names(None) == ["Fish Taco", "Fish Tostada", "Fish Ceviche"]
+    assert names(-1) == ["Fish Taco", "Fish Tostada"]
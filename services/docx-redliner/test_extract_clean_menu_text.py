@@ -14,15 +14,19 @@ from docx import Document
 from docx.enum.text import WD_COLOR_INDEX
 from docx.shared import RGBColor
 from lxml import etree
-from docx.oxml.ns import qn, nsmap
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn, nsmap
 
 from extract_clean_menu_text import (
     all_runs_in_paragraph,
+    deleted_runs_in_paragraph,
     extract_texts,
     paragraph_clean_html,
     paragraph_clean_text,
+    paragraph_clean_text_and_html,
     paragraph_unapproved_html,
     paragraph_unapproved_text,
+    run_inline_formatting,
     run_is_in_deleted_change,
     run_is_in_inserted_change,
     run_is_struck_through,
@@ -205,6 +209,24 @@ class TestTrackedChanges:
         assert "old" not in html
         assert "<strong>new</strong>" in html
 
+    def test_clean_text_and_html_in_one_pass(self):
+        """The fused clean-mode helper should agree with the separate ones."""
+        doc = Document()
+        para = doc.add_paragraph()
+        para.add_run("Tacos  ")
+        struck = para.add_run("old ")
+        struck.font.strike = True
+        para.add_run("")
+        para.add_run(" al pastor").italic = True
+        _inject_tracked_deletion(para, "remove this")
+        _inject_tracked_insertion(para, " salsa", bold=True)
+
+        assert paragraph_clean_text_and_html(para) == (
+            paragraph_clean_text(para),
+            paragraph_clean_html(para),
+        )
+        assert paragraph_clean_text(para) == "Tacos al pastor salsa"
+
     def test_tracked_changes_unapproved_marks_insertions(self):
         """Unapproved mode should mark tracked insertions.
         Note: w:del runs use w:delText (not w:t), so run.text is empty for them —
@@ -272,6 +294,45 @@ class TestAllRunsInParagraph:
         assert runs[1].text == "world"
 
 
+# ── Tests: deleted_runs_in_paragraph ────────────────────────────────────────
+
+class TestDeletedRunsInParagraph:
+    def test_matches_per_run_ancestor_check(self):
+        """The per-paragraph set should flag exactly the runs the per-run walk does."""
+        doc = Document()
+        para = doc.add_paragraph()
+        para.add_run("kept ")
+        _inject_tracked_deletion(para, "deleted ")
+        _inject_move_from(para, "moved away ")
+        _inject_tracked_insertion(para, "inserted")
+
+        deleted = deleted_runs_in_paragraph(para)
+        runs = all_runs_in_paragraph(para)
+        assert [r._r in deleted for r in runs] == [run_is_in_deleted_change(r) for r in runs]
+        assert [r._r in deleted for r in runs] == [False, True, True, False]
+
+
+# ── Tests: run_inline_formatting ────────────────────────────────────────────
+
+class TestRunInlineFormatting:
+    @pytest.mark.parametrize("rpr_xml", [
+        "",
+        "<w:b/><w:i/><w:u/>",
+        '<w:b w:val="0"/><w:i w:val="off"/><w:u w:val="none"/>',
+        '<w:b w:val="true"/><w:u w:val="single"/>',
+        '<w:i w:val="1"/><w:u w:val="double"/>',
+    ])
+    def test_matches_python_docx_properties(self, rpr_xml):
+        """Same truthiness as run.bold / run.italic / run.underline."""
+        para = Document().add_paragraph()
+        run = para.add_run("x")
+        if rpr_xml:
+            run._r.insert(0, parse_xml(f'<w:rPr {nsdecls("w")}>{rpr_xml}</w:rPr>'))
+        assert run_inline_formatting(run) == (
+            bool(run.bold), bool(run.italic), bool(run.underline)
+        )
+
+
 # ── Tests: Full extraction pipeline ─────────────────────────────────────────
 
 class TestFullExtraction:
@@ -5,6 +5,7 @@ import os
 import tempfile
 
 from docx import Document
+from docx.table import _Row
 
 from extract_project_details import detect_allergen_key, extract_project_details
 
@@ -89,8 +90,71 @@ def test_extract_project_details_returns_parenthesized_allergen_key():
     assert result["allergen_key"] == "D dairy | E eggs | G gluten | PN peanuts | SY soy | TN tree nuts"
 
 
+def test_first_value_wins_when_fields_repeat():
+    doc = Document()
+    table = doc.add_table(rows=0, cols=2)
+    rows = [
+        ("PROJECT NAME", "Brunch"),
+        ("PROPERTY", "Maya Dubai"),
+        ("OUTLET NAME", "Maya"),
+        ("HOTEL NAME", "Le Royal Meridien"),
+        ("CITY / COUNTRY", "Dubai"),
+        ("SIZE (PIXELS = WEB) OR (INCHES = PRINT)", "A4"),
+        ("ORIENTATION (PORTRAIT OR LANDSCAPE)", "Portrait"),
+        ("DATE NEEDED", "2026-05-20"),
+        ("MENU NAME", "Dinner"),
+        ("Location name", "Elsewhere"),
+    ]
+    for label, value in rows:
+        cells = table.add_row().cells
+        cells[0].text = label
+        cells[1].text = value
+
+    result = _save_and_extract(doc)
+
+    assert result["project_details"]["project_name"] == "Brunch"
+    assert result["project_details"]["property"] == "Maya Dubai"
+
+
+def test_stops_reading_table_rows_once_every_field_is_filled(monkeypatch):
+    doc = Document()
+    table = doc.add_table(rows=0, cols=2)
+    rows = [
+        ("PROJECT NAME", "Brunch"),
+        ("PROPERTY", "Maya Dubai"),
+        ("OUTLET NAME", "Maya"),
+        ("HOTEL NAME", "Le Royal Meridien"),
+        ("CITY / COUNTRY", "Dubai"),
+        ("SIZE (PIXELS = WEB) OR (INCHES = PRINT)", "A4"),
+        ("ORIENTATION (PORTRAIT OR LANDSCAPE)", "Portrait"),
+        ("DATE NEEDED", "2026-05-20"),
+        ("NOTES", "never read"),
+        ("MORE NOTES", "never read"),
+    ]
+    for label, value in rows:
+        cells = table.add_row().cells
+        cells[0].text = label
+        cells[1].text = value
+
+    read_labels = []
+    real_cells = _Row.cells
+
+    def recording_cells(row):
+        cells = real_cells.fget(row)
+        read_labels.append(cells[0].text)
+        return cells
+
+    monkeypatch.setattr(_Row, "cells", property(recording_cells))
+
+    result = _save_and_extract(doc)
+
+    assert read_labels == [label for label, _ in rows[:8]]
+    assert result["project_details"]["date_needed"] == "2026-05-20"
+
+
 if __name__ == "__main__":
     test_extracts_split_property_fields_from_new_template()
     test_detects_parenthesized_allergen_key()
     test_parenthesized_allergen_key_stops_before_footer_copy()
     test_extract_project_details_returns_parenthesized_allergen_key()
+    test_first_value_wins_when_fields_repeat()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Tests for the page-2 menu format linter."""
+
+import os
+import tempfile
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt
+
+from format_lint import BOUNDARY_MARKER, lint
+
+
+def _save_and_lint(doc):
+    with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as f:
+        doc.save(f.name)
+        try:
+            return lint(f.name)
+        finally:
+            os.unlink(f.name)
+
+
+def _centered(doc, text):
+    para = doc.add_paragraph(text)
+    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    return para
+
+
+def test_only_checks_non_empty_paragraphs_after_boundary_marker():
+    doc = Document()
+    doc.add_paragraph("Project details, left aligned")
+    doc.add_paragraph(BOUNDARY_MARKER)
+    _centered(doc, "Taco - grilled fish")
+    doc.add_paragraph("")
+    _centered(doc, "Ceviche - lime, chili")
+
+    report = _save_and_lint(doc)
+
+    assert report["passed"] is True
+    assert report["totals"]["menu_paragraphs"] == 2
+    assert report["samples"]["not_centered"] == []
+
+
+def test_reports_offending_paragraph_text():
+    doc = Document()
+    doc.add_paragraph(BOUNDARY_MARKER)
+    doc.add_paragraph("  Left aligned dish  ")
+    para = _centered(doc, "Big dish")
+    para.runs[0].font.size = Pt(14)
+    para = _centered(doc, "Fancy dish")
+    para.runs[0].font.name = "Arial"
+
+    report = _save_and_lint(doc)
+
+    assert report["passed"] is False
+    assert report["samples"] == {
+        "not_centered": ["Left aligned dish"],
+        "size_mismatch": ["Big dish"],
+        "font_mismatch": ["Fancy dish"],
+    }
+
+
+def test_falls_back_to_whole_document_without_marker():
+    doc = Document()
+    _centered(doc, "Taco")
+    doc.add_paragraph("")
+    _centered(doc, "Ceviche")
+
+    report = _save_and_lint(doc)
+
+    assert report["totals"]["menu_paragraphs"] == 2
+    assert report["checks"]["center_alignment"] is True
+
+
+def test_caps_samples_but_counts_every_paragraph_for_centering():
+    doc = Document()
+    doc.add_paragraph(BOUNDARY_MARKER)
+    for i in range(8):
+        para = doc.add_paragraph(f"Dish {i}")
+        para.runs[0].font.size = Pt(10)
+        para.runs[0].font.name = "Arial"
+    for i in range(2):
+        _centered(doc, f"Centered dish {i}")
+
+    report = _save_and_lint(doc)
+
+    assert report["samples"]["size_mismatch"] == [f"Dish {i}" for i in range(5)]
+    assert report["samples"]["font_mismatch"] == [f"Dish {i}" for i in range(5)]
+    assert report["reasons"][0] == "Menu paragraphs are not centered per SOP (only 20% centered)."